@@ -14,10 +14,18 @@ cache without modifying import order or relying on global state.
 
 from __future__ import annotations
 
+import hashlib
+import logging
+import os
 from collections import OrderedDict
 from contextlib import contextmanager
 from threading import RLock
-from typing import Any, Callable, Iterator, Optional, Tuple
+from typing import Any, Callable, Iterable, Iterator, Optional, Tuple
+
+from PySide6.QtCore import QSize, QStandardPaths, QThread, QThreadPool
+from PySide6.QtGui import QImage
+
+from . import config
 
 
 class ImageCache:
@@ -44,18 +52,38 @@ class ImageCache:
             self._cache[key] = value  # re-insert as most recent
             return value
 
+    def _capacity(self) -> int:
+        return max(1, int(self.max_size * self.cleanup_threshold))
+
+    def _evict_overflow(self) -> None:
+        """Drop least recently used entries one at a time down to capacity."""
+        capacity = self._capacity()
+        while len(self._cache) > capacity:
+            self._cache.popitem(last=False)
+
     def put(self, key: str, pixmap: Any, metadata: dict) -> None:
         """Insert *key* into the cache.
 
-        When the cache grows beyond ``max_size * cleanup_threshold`` a cleanup
-        pass removes the least recently used entries.
+        Once the cache holds ``max_size * cleanup_threshold`` entries, each
+        insert evicts just the least recently used entry (O(1)) instead of
+        sweeping half the cache at once.
         """
         with self._lock:
-            if key in self._cache:
-                self._cache.pop(key)
-            elif len(self._cache) >= self.max_size * self.cleanup_threshold:
-                self._cleanup()
+            self._cache.pop(key, None)
             self._cache[key] = (pixmap, metadata)
+            self._evict_overflow()
+
+    def put_many(self, items: Iterable[Tuple[str, Any, dict]]) -> None:
+        """Insert several ``(key, pixmap, metadata)`` entries at once.
+
+        The lock is taken once for the whole batch and overflow is evicted
+        afterwards, so batch loaders do not contend per image.
+        """
+        with self._lock:
+            for key, pixmap, metadata in items:
+                self._cache.pop(key, None)
+                self._cache[key] = (pixmap, metadata)
+            self._evict_overflow()
 
     def _cleanup(self) -> None:
         """Remove the oldest entries until the cache is at half capacity."""
@@ -70,7 +98,10 @@ class ImageCache:
 
     # Public wrapper to avoid using a private method from callers
     def cleanup(self) -> None:
-        """Evict least-recently-used entries down to half capacity."""
+        """Evict least-recently-used entries down to half capacity.
+
+        Used to shed memory under pressure; routine inserts evict singly.
+        """
         with self._lock:
             self._cleanup()
 
@@ -173,10 +204,310 @@ class _ImageCacheProxy:
 # Global proxy used throughout the application for backward compatibility
 image_cache = _ImageCacheProxy()
 
+
+class ScaledPixmapCache:
+    """Thread-safe LRU of scaled pixmaps.
+
+    Entries are keyed by the source pixmap's ``cacheKey()``, the target size
+    and the aspect/transformation modes. Qt changes ``cacheKey()`` whenever
+    a pixmap's pixels are modified, so edited sources never hit stale scales.
+    Eviction honours both an entry count and, when given, a pixel-data
+    budget in bytes so large HiDPI cells cannot grow the cache unbounded.
+    """
+
+    def __init__(self, max_size: int = 128, max_bytes: Optional[int] = None) -> None:
+        self.max_size = max_size
+        self.max_bytes = max_bytes
+        self._cache: "OrderedDict[tuple, Any]" = OrderedDict()
+        self._bytes = 0
+        self._lock = RLock()
+
+    @staticmethod
+    def _cost(pixmap: Any) -> int:
+        return pixmap.width() * pixmap.height() * max(pixmap.depth(), 8) // 8
+
+    def _over_budget(self) -> bool:
+        if len(self._cache) > self.max_size:
+            return True
+        return self.max_bytes is not None and self._bytes > self.max_bytes and len(self._cache) > 1
+
+    def get_or_scale(self, pixmap: Any, size: Any, aspect_mode: Any, transform_mode: Any) -> Any:
+        """Return ``pixmap.scaled(size, aspect_mode, transform_mode)``, cached."""
+        key = (pixmap.cacheKey(), size.width(), size.height(), aspect_mode, transform_mode)
+        with self._lock:
+            scaled = self._cache.get(key)
+            if scaled is not None:
+                self._cache.move_to_end(key)
+                return scaled
+        scaled = pixmap.scaled(size, aspect_mode, transform_mode)
+        with self._lock:
+            previous = self._cache.pop(key, None)
+            if previous is not None:
+                self._bytes -= self._cost(previous)
+            self._cache[key] = scaled
+            self._bytes += self._cost(scaled)
+            while self._over_budget():
+                _, evicted = self._cache.popitem(last=False)
+                self._bytes -= self._cost(evicted)
+        return scaled
+
+    def invalidate(self, pixmap: Any) -> None:
+        """Drop every scaled entry derived from *pixmap*."""
+        source = pixmap.cacheKey()
+        with self._lock:
+            for key in [key for key in self._cache if key[0] == source]:
+                self._bytes -= self._cost(self._cache.pop(key))
+
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        with self._lock:
+            self._cache.clear()
+            self._bytes = 0
+
+
+class MipmapCache:
+    """Thread-safe LRU of mip chains, bounded by entry count and bytes.
+
+    Entries are keyed by the source pixmap's ``cacheKey()`` and hold only the
+    reduced levels, never the source itself, so evicting or clearing an
+    entry frees exactly the memory the chain added.
+    """
+
+    def __init__(self, max_size: int = 64, max_bytes: Optional[int] = None) -> None:
+        self.max_size = max_size
+        self.max_bytes = max_bytes
+        self._cache: "OrderedDict[int, list]" = OrderedDict()
+        self._bytes = 0
+        self._lock = RLock()
+
+    @staticmethod
+    def _cost(levels: list) -> int:
+        return sum(ScaledPixmapCache._cost(level) for level in levels)
+
+    def _over_budget(self) -> bool:
+        if len(self._cache) > self.max_size:
+            return True
+        return self.max_bytes is not None and self._bytes > self.max_bytes and len(self._cache) > 1
+
+    def get_or_build(self, source: Any, build: Callable[[Any], list]) -> list:
+        """Return the reduced levels of *source*, calling ``build(source)`` on a miss.
+
+        ``build`` returns the full chain starting with *source*; only the
+        levels after it are kept.
+        """
+        key = source.cacheKey()
+        with self._lock:
+            levels = self._cache.get(key)
+            if levels is not None:
+                self._cache.move_to_end(key)
+                return levels
+        levels = build(source)[1:]
+        with self._lock:
+            previous = self._cache.pop(key, None)
+            if previous is not None:
+                self._bytes -= self._cost(previous)
+            self._cache[key] = levels
+            self._bytes += self._cost(levels)
+            while self._over_budget():
+                _, evicted = self._cache.popitem(last=False)
+                self._bytes -= self._cost(evicted)
+        return levels
+
+    def clear(self) -> None:
+        """Remove all cached chains."""
+        with self._lock:
+            self._cache.clear()
+            self._bytes = 0
+
+
+_scaled_pixmap_cache: Optional[ScaledPixmapCache] = None
+_scaled_pixmap_cache_lock = RLock()
+
+
+def get_scaled_pixmap_cache() -> ScaledPixmapCache:
+    """Return the process-wide scaled pixmap cache."""
+
+    global _scaled_pixmap_cache
+    with _scaled_pixmap_cache_lock:
+        if _scaled_pixmap_cache is None:
+            _scaled_pixmap_cache = ScaledPixmapCache(
+                config.SCALED_PIXMAP_CACHE_SIZE, config.SCALED_PIXMAP_CACHE_BYTES
+            )
+        return _scaled_pixmap_cache
+
+
+_mipmap_cache: Optional[MipmapCache] = None
+_mipmap_cache_lock = RLock()
+
+
+def get_mipmap_cache() -> MipmapCache:
+    """Return the process-wide mip chain cache."""
+
+    global _mipmap_cache
+    with _mipmap_cache_lock:
+        if _mipmap_cache is None:
+            _mipmap_cache = MipmapCache(config.MIPMAP_CACHE_SIZE, config.MIPMAP_CACHE_BYTES)
+        return _mipmap_cache
+
+
+class ThumbnailDiskCache:
+    """Display-size decodes persisted as lossy image files across sessions.
+
+    Entries are named by a hash of the source path, its mtime and byte size
+    and the decode size, so an edited source simply misses and its stale
+    file ages out. Opaque decodes are stored as JPEG, ones with alpha as
+    WebP. Writes run on a single lowest-priority thread, and the directory
+    is pruned to ``max_bytes``, least recently written first.
+    """
+
+    _EXTENSIONS = (".jpg", ".webp")
+
+    def __init__(self, directory: str, max_bytes: int, quality: int = 85) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.quality = quality
+        os.makedirs(directory, exist_ok=True)
+        self._lock = RLock()
+        # Start due, so the first write of a session also prunes what
+        # earlier sessions left behind.
+        self._written_since_prune = self._prune_interval()
+        self._writer = QThreadPool()
+        self._writer.setMaxThreadCount(1)
+        self._writer.setThreadPriority(QThread.LowestPriority)
+
+    def _prune_interval(self) -> int:
+        return max(1, self.max_bytes // 16)
+
+    def _entry_base(self, file_path: str, size: QSize) -> Optional[str]:
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+        key = f"{os.path.abspath(file_path)}\0{stat.st_mtime_ns}\0{stat.st_size}\0{size.width()}x{size.height()}"
+        name = hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+        return os.path.join(self.directory, name)
+
+    def load(self, file_path: str, size: QSize) -> Optional[QImage]:
+        """Return the stored decode of *file_path* at *size*, or None."""
+        base = self._entry_base(file_path, size)
+        if base is None:
+            return None
+        for extension in self._EXTENSIONS:
+            if os.path.exists(base + extension):
+                image = QImage(base + extension)
+                return None if image.isNull() else image
+        return None
+
+    def store_later(self, file_path: str, size: QSize, image: QImage) -> None:
+        """Queue :meth:`store` on the cache's low-priority writer thread.
+
+        Safe from any thread; *image* is only read, so the implicitly shared
+        QImage is handed over without a copy.
+        """
+        self._writer.start(lambda: self.store(file_path, size, image))
+
+    def wait_for_idle(self, timeout_ms: int = -1) -> bool:
+        """Block until queued writes finish; mainly for tests."""
+        return self._writer.waitForDone(timeout_ms)
+
+    def store(self, file_path: str, size: QSize, image: QImage) -> None:
+        """Persist *image* as the decode of *file_path* at *size*."""
+        base = self._entry_base(file_path, size)
+        if base is None:
+            return
+        fmt, extension = ("WEBP", ".webp") if image.hasAlphaChannel() else ("JPEG", ".jpg")
+        path = base + extension
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            if not image.save(tmp_path, fmt, self.quality):
+                raise OSError(f"could not write {tmp_path}")
+            written = os.path.getsize(tmp_path)
+            os.replace(tmp_path, path)
+        except OSError as exc:
+            logging.warning("Thumbnail cache write failed: %s", exc)
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return
+        with self._lock:
+            self._written_since_prune += written
+            prune = self._written_since_prune >= self._prune_interval()
+            if prune:
+                self._written_since_prune = 0
+        if prune:
+            self.prune()
+
+    def prune(self) -> None:
+        """Delete the least recently written entries beyond ``max_bytes``."""
+        try:
+            with os.scandir(self.directory) as entries:
+                files = []
+                for entry in entries:
+                    if entry.name.endswith(self._EXTENSIONS) and entry.is_file():
+                        stat = entry.stat()
+                        files.append((stat.st_mtime, stat.st_size, entry.path))
+        except OSError:
+            return
+        total = sum(size for _, size, _ in files)
+        files.sort()
+        for _, size, path in files:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+
+
+_thumbnail_cache: Optional[ThumbnailDiskCache] = None
+_thumbnail_cache_lock = RLock()
+
+
+def _thumbnail_cache_dir() -> Optional[str]:
+    if config.THUMBNAIL_CACHE_DIR:
+        return config.THUMBNAIL_CACHE_DIR
+    base = QStandardPaths.writableLocation(QStandardPaths.CacheLocation)
+    return os.path.join(base, "thumbnails") if base else None
+
+
+def get_thumbnail_cache() -> Optional[ThumbnailDiskCache]:
+    """Return the disk thumbnail cache, or ``None`` when it is disabled.
+
+    It lives in config.THUMBNAIL_CACHE_DIR, defaulting to a ``thumbnails``
+    folder under the platform cache location.
+    """
+
+    global _thumbnail_cache
+    if not config.THUMBNAIL_CACHE_ENABLED:
+        return None
+    directory = _thumbnail_cache_dir()
+    if not directory:
+        return None
+    with _thumbnail_cache_lock:
+        if _thumbnail_cache is None or _thumbnail_cache.directory != directory:
+            try:
+                _thumbnail_cache = ThumbnailDiskCache(
+                    directory,
+                    config.THUMBNAIL_CACHE_MAX_BYTES,
+                    config.THUMBNAIL_CACHE_QUALITY,
+                )
+            except OSError as exc:
+                logging.warning("Thumbnail cache disabled: %s", exc)
+                return None
+        return _thumbnail_cache
+
 __all__ = [
     "ImageCache",
+    "MipmapCache",
+    "ScaledPixmapCache",
+    "ThumbnailDiskCache",
     "configure_cache",
     "get_cache",
+    "get_mipmap_cache",
+    "get_scaled_pixmap_cache",
+    "get_thumbnail_cache",
     "image_cache",
     "override_cache",
 ]
@@ -2,6 +2,7 @@
 """
 Application configuration constants for Collage Maker
 """
+import os
 
 # Grid defaults
 DEFAULT_ROWS = 2
@@ -9,10 +10,19 @@ DEFAULT_COLUMNS = 2
 DEFAULT_CELL_SIZE = 260
 # UI spacing (pixels)
 DEFAULT_SPACING = 8
+# Quiet period before caption control changes are applied to the cells
+CAPTION_UPDATE_DEBOUNCE_MS = 50
 
 # Cache settings
 MAX_CACHE_SIZE = 50
-CACHE_CLEANUP_THRESHOLD = 0.8  # Cleanup when cache reaches 80% of max size
+CACHE_CLEANUP_THRESHOLD = 0.8  # Inserts evict LRU entries beyond 80% of max size
+SCALED_PIXMAP_CACHE_SIZE = 128  # Cell-sized scaled pixmaps kept for repaints
+SCALED_PIXMAP_CACHE_BYTES = 128 * 1024 * 1024  # Pixel budget for those pixmaps (HiDPI cells are large)
+# Display-size decodes of non-JPEG sources persisted across runs
+THUMBNAIL_CACHE_ENABLED = True
+THUMBNAIL_CACHE_DIR = None  # None: "thumbnails" under QStandardPaths.CacheLocation
+THUMBNAIL_CACHE_MAX_BYTES = 256 << 20
+THUMBNAIL_CACHE_QUALITY = 85  # JPEG/WebP quality of stored thumbnails
 
 # Supported image formats
 SUPPORTED_IMAGE_FORMATS = ['png', 'jpg', 'jpeg', 'bmp', 'webp', 'avif', 'gif', 'tiff']
@@ -20,16 +30,26 @@ SUPPORTED_IMAGE_FORMATS = ['png', 'jpg', 'jpeg', 'bmp', 'webp', 'avif', 'gif', '
 # Image dimension limits
 MAX_IMAGE_DIMENSION = 4000       # Maximum width/height for loaded images
 MAX_DISPLAY_DIMENSION = 2000     # Maximum dimension for display optimization
+MIPMAP_MIN_SIDE = 64             # Smallest side kept when halving originals into a mip chain
+MIPMAP_CACHE_SIZE = 64           # Originals whose mip chains are kept
+MIPMAP_CACHE_BYTES = 128 * 1024 * 1024  # Pixel budget for those chains
+DECODE_DOWNSCALE_THRESHOLD = 4   # Decode display-only images reduced once source exceeds display by this factor
+DECODE_OVERSAMPLE = 2            # Reduced decodes target this multiple of the display size
+# Concurrent image decodes; decoding is memory-bound, more threads stop helping past ~4
+IMAGE_LOAD_THREADS = min(os.cpu_count() or 1, 4)
 
 # Autosave settings
 AUTOSAVE_INTERVAL_MS = 5 * 60 * 1000  # 5 minutes in milliseconds
 AUTOSAVE_PATH = "autosave"
 MAX_AUTOSAVE_FILES = 5
 AUTOSAVE_TIMESTAMP_FORMAT = "yyyyMMdd_HHmmss"
+AUTOSAVE_FSYNC_EVERY = 4  # fsync one snapshot in this many; keep below MAX_AUTOSAVE_FILES
 
 # Performance monitor settings
 MEMORY_THRESHOLD_BYTES = 500 << 20  # 500 MB
 MEMORY_CLEANUP_INTERVAL_SECS = 300  # 5 minutes in seconds
+UNDO_HISTORY_MAX_BYTES = 256 << 20  # Encoded image payloads kept for undo/redo
+UNDO_HISTORY_PRESSURE_BYTES = 64 << 20  # Undo budget applied under memory pressure
 
 # Error recovery settings
 ERROR_THRESHOLD = 5
@@ -47,3 +67,7 @@ RESOLUTION_MULTIPLIERS = [1, 2, 4]
 
 # Export limits
 MAX_EXPORT_DIMENSION = 10000  # Clamp largest side when exporting to avoid huge images
+
+# Export resampling (Pillow filter names: nearest, box, bilinear, bicubic, lanczos)
+EXPORT_UPSCALE_FILTER = "lanczos"
+EXPORT_DOWNSCALE_FILTER = "box"  # Area averaging when shrinking
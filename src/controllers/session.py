@@ -12,8 +12,9 @@ without depending on ``QWidget`` internals.
 from __future__ import annotations
 
 import copy
+from collections import deque
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Deque, Dict, Optional
 
 
 class UndoUnavailableError(RuntimeError):
@@ -24,9 +25,59 @@ class RedoUnavailableError(RuntimeError):
     """Raised when a redo operation is requested with no history."""
 
 
+def _share_unchanged(value: Any, previous: Any) -> Any:
+    """Return *value* with parts equal to *previous* replaced by *previous*'s objects.
+
+    Consecutive snapshots usually differ in a cell or two, so sharing the
+    equal subtrees makes each history entry cost roughly its delta. Large
+    image payload strings are reused by the cells between reads, which lets
+    the equality checks short-circuit on identity.
+    """
+    if value is previous or value == previous:
+        return previous
+    if isinstance(value, dict) and isinstance(previous, dict):
+        return {
+            key: _share_unchanged(item, previous[key]) if key in previous else item
+            for key, item in value.items()
+        }
+    if (
+        isinstance(value, list)
+        and isinstance(previous, list)
+        and len(value) == len(previous)
+    ):
+        return [
+            _share_unchanged(item, old)
+            for item, old in zip(value, previous, strict=True)
+        ]
+    return value
+
+
+def _payload_sizes(entry: Any) -> Dict[int, int]:
+    """Return ``id -> length`` for the string payloads reachable from *entry*.
+
+    Objects shared within the entry are listed once; callers keep the entry
+    alive while they hold the ids.
+    """
+    sizes: Dict[int, int] = {}
+    pending = [entry]
+    while pending:
+        item = pending.pop()
+        if isinstance(item, dict):
+            pending.extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            pending.extend(item)
+        elif isinstance(item, (str, bytes)):
+            sizes[id(item)] = len(item)
+    return sizes
+
+
 @dataclass(frozen=True)
 class CollageStateAdapter:
-    """Adapter encapsulating how to read and apply collage state."""
+    """Adapter encapsulating how to read and apply collage state.
+
+    ``read_state`` must build a fresh mapping on every call; the controller
+    keeps those mappings as immutable history entries without copying them.
+    """
 
     read_state: Callable[[], Dict[str, Any]]
     apply_state: Callable[[Dict[str, Any]], None]
@@ -40,15 +91,19 @@ class CollageSessionController:
         adapter: CollageStateAdapter,
         *,
         history_limit: int = 30,
+        max_history_bytes: Optional[int] = None,
     ) -> None:
         if history_limit <= 0:
             raise ValueError("history_limit must be greater than zero")
         self._adapter = adapter
         self._history_limit = history_limit
-        self._undo_stack: List[Dict[str, Any]] = []
-        self._redo_stack: List[Dict[str, Any]] = []
+        self._max_history_bytes = max_history_bytes
+        # Entries are never mutated once stored, so snapshots may share
+        # unchanged subtrees with each other and with the baseline.
+        self._undo_stack: Deque[Dict[str, Any]] = deque(maxlen=history_limit)
+        self._redo_stack: Deque[Dict[str, Any]] = deque(maxlen=history_limit)
         self._is_restoring = False
-        self._history_baseline: Dict[str, Any] = copy.deepcopy(self._adapter.read_state())
+        self._history_baseline: Dict[str, Any] = self._adapter.read_state()
 
     @property
     def is_restoring(self) -> bool:
@@ -61,13 +116,46 @@ class CollageSessionController:
 
         if self._is_restoring:
             return False
-        snapshot = copy.deepcopy(self._history_baseline)
-        self._undo_stack.append(snapshot)
-        if len(self._undo_stack) > self._history_limit:
-            self._undo_stack.pop(0)
+        self._undo_stack.append(self._history_baseline)
         self._redo_stack.clear()
+        self._enforce_budget()
         return True
 
+    def trim_history(self, max_bytes: int) -> None:
+        """Evict the oldest entries until history payloads fit in *max_bytes*.
+
+        The most recent undo step is always kept. Used with the configured
+        budget after each push and with a lower one under memory pressure.
+        """
+        stacks = (self._undo_stack, self._redo_stack)
+        payloads = [[_payload_sizes(entry) for entry in stack] for stack in stacks]
+        # Payloads shared between entries are counted once and only stop
+        # counting when the last entry holding them is evicted, so the total
+        # is computed a single time and each eviction just subtracts.
+        holders: Dict[int, int] = {}
+        total = 0
+        for entries in payloads:
+            for sizes in entries:
+                for key, size in sizes.items():
+                    if key not in holders:
+                        holders[key] = 0
+                        total += size
+                    holders[key] += 1
+        for stack, entries in zip(stacks, payloads, strict=True):
+            evicted = 0
+            while len(stack) - evicted > 1 and total > max_bytes:
+                for key, size in entries[evicted].items():
+                    holders[key] -= 1
+                    if not holders[key]:
+                        total -= size
+                evicted += 1
+            for _ in range(evicted):
+                stack.popleft()
+
+    def _enforce_budget(self) -> None:
+        if self._max_history_bytes is not None:
+            self.trim_history(self._max_history_bytes)
+
     def discard_latest_snapshot(self) -> None:
         """Drop the most recently captured undo snapshot if present."""
 
@@ -79,7 +167,9 @@ class CollageSessionController:
 
         if state is None:
             state = self._adapter.read_state()
-        self._history_baseline = copy.deepcopy(state)
+        else:
+            state = copy.deepcopy(state)
+        self._history_baseline = _share_unchanged(state, self._history_baseline)
 
     def reset_history(self) -> None:
         """Clear undo/redo stacks and resync the baseline from the adapter."""
@@ -93,12 +183,18 @@ class CollageSessionController:
 
         if not state:
             return
+        self._apply(state)
+        self.update_baseline(state)
+
+    def _apply(self, state: Dict[str, Any]) -> None:
         self._is_restoring = True
         try:
             self._adapter.apply_state(copy.deepcopy(state))
         finally:
             self._is_restoring = False
-        self.update_baseline(state)
+
+    def _read_current(self) -> Dict[str, Any]:
+        return _share_unchanged(self._adapter.read_state(), self._history_baseline)
 
     def undo(self) -> None:
         """Restore the previous snapshot, pushing the current state to redo."""
@@ -106,11 +202,11 @@ class CollageSessionController:
         if not self._undo_stack:
             raise UndoUnavailableError("No undo history is available")
         snapshot = self._undo_stack.pop()
-        current = copy.deepcopy(self._adapter.read_state())
-        self._redo_stack.append(current)
-        if len(self._redo_stack) > self._history_limit:
-            self._redo_stack.pop(0)
-        self.restore_state(snapshot)
+        self._redo_stack.append(self._read_current())
+        self._enforce_budget()
+        if snapshot:
+            self._apply(snapshot)
+            self._history_baseline = snapshot
 
     def redo(self) -> None:
         """Reapply the next snapshot in the redo stack."""
@@ -118,11 +214,11 @@ class CollageSessionController:
         if not self._redo_stack:
             raise RedoUnavailableError("No redo history is available")
         snapshot = self._redo_stack.pop()
-        current = copy.deepcopy(self._adapter.read_state())
-        self._undo_stack.append(current)
-        if len(self._undo_stack) > self._history_limit:
-            self._undo_stack.pop(0)
-        self.restore_state(snapshot)
+        self._undo_stack.append(self._read_current())
+        self._enforce_budget()
+        if snapshot:
+            self._apply(snapshot)
+            self._history_baseline = snapshot
 
     def current_state(self) -> Dict[str, Any]:
         """Return a deep copy of the current adapter state."""
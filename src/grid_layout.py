@@ -8,8 +8,9 @@ unit tested without a Qt environment.
 
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass
-from typing import List, Tuple, Optional, Dict, Any
+from typing import Deque, List, Tuple, Optional, Dict, Any
 import json
 import copy
 
@@ -66,7 +67,14 @@ class LayoutCell:
 class GridLayoutManager:
     """Maintain and edit a grid based collage layout."""
 
-    def __init__(self, rows: int, columns: int, gutter: int = 0, padding: int = 0):
+    def __init__(
+        self,
+        rows: int,
+        columns: int,
+        gutter: int = 0,
+        padding: int = 0,
+        history_limit: int = 50,
+    ):
         if rows <= 0 or columns <= 0:
             raise ValueError("Grid must have positive dimensions")
         self.rows = rows
@@ -79,15 +87,22 @@ class GridLayoutManager:
             for c in range(columns)
         ]
         self._next_id = rows * columns
-        self._undo_stack: List[List[LayoutCell]] = []
-        self._redo_stack: List[List[LayoutCell]] = []
+        # Bounded so long editing sessions do not grow history without limit.
+        self._undo_stack: Deque[List[LayoutCell]] = deque(maxlen=history_limit)
+        self._redo_stack: Deque[List[LayoutCell]] = deque(maxlen=history_limit)
         self.last_emitted: str = self._emit_layout()
 
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
+    def _copy_cells(self) -> List[LayoutCell]:
+        # LayoutCell fields are immutable values (ratio is a tuple), so a
+        # shallow copy per cell is a full snapshot without deepcopy's
+        # recursive memo walk.
+        return [copy.copy(cell) for cell in self.cells]
+
     def _snapshot(self) -> None:
-        self._undo_stack.append(copy.deepcopy(self.cells))
+        self._undo_stack.append(self._copy_cells())
         self._redo_stack.clear()
 
     def _emit_layout(self) -> str:
@@ -250,14 +265,14 @@ class GridLayoutManager:
     def undo(self) -> str:
         if not self._undo_stack:
             raise ValueError("Nothing to undo")
-        self._redo_stack.append(copy.deepcopy(self.cells))
+        self._redo_stack.append(self._copy_cells())
         self.cells = self._undo_stack.pop()
         return self._emit_layout()
 
     def redo(self) -> str:
         if not self._redo_stack:
             raise ValueError("Nothing to redo")
-        self._undo_stack.append(copy.deepcopy(self.cells))
+        self._undo_stack.append(self._copy_cells())
         self.cells = self._redo_stack.pop()
         return self._emit_layout()
 
@@ -2,15 +2,23 @@
 """
 Entry point and main application window for Collage Maker.
 """
+import gc
 import logging
 import os
 import sys
 from dataclasses import dataclass
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
-from typing import Any, Dict, Optional, Sequence
-
-from PySide6.QtCore import QPoint, QStandardPaths, Qt, QThreadPool, QTimer
+from typing import Any, Callable, Dict, Optional, Sequence
+
+from PySide6.QtCore import (
+    QPoint,
+    QSize,
+    QStandardPaths,
+    Qt,
+    QTimer,
+    Signal,
+)
 from PySide6.QtGui import (
     QImage,
     QImageReader,
@@ -37,6 +45,9 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from PIL.PngImagePlugin import PngInfo
+from shiboken6 import isValid
+
 from utils.validation import validate_image_path, validate_output_path
 
 try:
@@ -56,7 +67,7 @@ try:
     from .widgets.control_panel import CaptionDefaults, ControlPanel, GridDefaults
     from .widgets.collage import CollageWidget
     from .widgets.control_panel import CaptionDefaults, ControlPanel, GridDefaults
-    from .workers import Worker
+    from .workers import Worker, get_task_queue
     from .presenter import CollagePresenter
 except ImportError:
     # Fallback for running `python src/main.py` directly
@@ -78,7 +89,7 @@ except ImportError:
     from src.widgets.control_panel import CaptionDefaults, ControlPanel, GridDefaults
     from src.widgets.collage import CollageWidget
     from src.widgets.control_panel import CaptionDefaults, ControlPanel, GridDefaults
-    from src.workers import Worker
+    from src.workers import Worker, get_task_queue
     from src.presenter import CollagePresenter
 
 LOGGER_NAME = "collage_maker"
@@ -135,6 +146,10 @@ sys.excepthook = global_exception_handler
 
 
 class MainWindow(QMainWindow):
+    # Emitted once an export finishes writing: (succeeded, details).
+    # ``details`` holds ``path``/``original`` on success or ``error`` on failure.
+    exportFinished = Signal(bool, dict)
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Collage Maker - PySide6")
@@ -172,7 +187,7 @@ class MainWindow(QMainWindow):
         self._bind_control_panel()
         self.caption_timer = QTimer(self)
         self.caption_timer.setSingleShot(True)
-        self.caption_timer.setInterval(150)
+        self.caption_timer.setInterval(config.CAPTION_UPDATE_DEBOUNCE_MS)
         self.caption_timer.timeout.connect(self._apply_captions_now)
         # Separator under the toolbar (thin)
         sep = QFrame()
@@ -201,6 +216,11 @@ class MainWindow(QMainWindow):
             self, save_state=self.get_collage_state, reset_callback=self._reset_collage
         )
 
+        self.exportFinished.connect(self._notify_export_finished)
+        # Reused for every export render; begin()/end() per target image.
+        # Only touched on the GUI thread, so no locking is required.
+        self._export_painter = QPainter()
+
         # Shortcuts
         self._create_shortcuts()
 
@@ -237,8 +257,8 @@ class MainWindow(QMainWindow):
         panel.colorPickRequested.connect(self._pick_color)
 
     def _schedule_caption_apply(self) -> None:
-        if self.caption_timer.isActive():
-            self.caption_timer.stop()
+        # start() restarts a running timer, so a burst of spinbox/checkbox
+        # changes collapses into one pass over the cells.
         self.caption_timer.start()
 
     def _pick_color(self, which: str):
@@ -247,7 +267,7 @@ class MainWindow(QMainWindow):
             return
         self._ensure_caption_snapshot()
         changed = False
-        for cell in [c for c in self.collage.cells if getattr(c, "selected", False)]:
+        for cell in self.collage.selected_cells():
             cell_changed = False
             if which == "stroke":
                 if cell.caption_stroke_color != col:
@@ -273,7 +293,7 @@ class MainWindow(QMainWindow):
         stroke_w = self.stroke_width_spin.value()
         upper = self.uppercase_chk.isChecked()
         changed = False
-        for cell in [c for c in self.collage.cells if getattr(c, "selected", False)]:
+        for cell in self.collage.selected_cells():
             cell_changed = False
             if cell.top_caption and cell.show_top_caption != show_top:
                 cell.show_top_caption = show_top
@@ -312,24 +332,33 @@ class MainWindow(QMainWindow):
         self.font_size_spin.blockSignals(False)
 
     def _create_shortcuts(self):
-        QShortcut(
-            QKeySequence(config.SAVE_SHORTCUT), self, activated=self._show_save_dialog
-        )
-        QShortcut(
-            QKeySequence(config.SAVE_ORIGINAL_SHORTCUT),
-            self,
-            activated=lambda: self._show_save_dialog(default_original=True),
-        )
-        QShortcut(QKeySequence.Undo, self, activated=self._undo)
-        QShortcut(QKeySequence.Redo, self, activated=self._redo)
-        QShortcut(QKeySequence.SelectAll, self, activated=self._select_all)
-        QShortcut(QKeySequence.Delete, self, activated=self._delete_selected)
-        QShortcut(QKeySequence("Ctrl+O"), self, activated=self._add_images)
-        QShortcut(QKeySequence("Ctrl+Shift+C"), self, activated=self._reset_collage)
-        QShortcut(QKeySequence("Ctrl+M"), self, activated=self._merge_selected_cells)
-        QShortcut(
-            QKeySequence("Ctrl+Shift+M"), self, activated=self._split_selected_cells
-        )
+        for sequence, slot in (
+            (config.SAVE_SHORTCUT, self._show_save_dialog),
+            (
+                config.SAVE_ORIGINAL_SHORTCUT,
+                lambda: self._show_save_dialog(default_original=True),
+            ),
+            (QKeySequence.Undo, self._undo),
+            (QKeySequence.Redo, self._redo),
+            ("Ctrl+O", self._add_images),
+            ("Ctrl+Shift+C", self._reset_collage),
+        ):
+            QShortcut(QKeySequence(sequence), self, activated=slot)
+        # Grid editing keys only apply while focus is inside the collage, so
+        # they are matched against its subtree instead of the whole window
+        # and leave Ctrl+A/Delete to the control panel's text fields.
+        for sequence, slot in (
+            (QKeySequence.SelectAll, self._select_all),
+            (QKeySequence.Delete, self._delete_selected),
+            (QKeySequence("Ctrl+M"), self._merge_selected_cells),
+            (QKeySequence("Ctrl+Shift+M"), self._split_selected_cells),
+        ):
+            QShortcut(
+                QKeySequence(sequence),
+                self.collage,
+                activated=slot,
+                context=Qt.WidgetWithChildrenShortcut,
+            )
 
     # --- Undo / Redo helpers ---
     def _init_history_tracking(self) -> None:
@@ -340,6 +369,7 @@ class MainWindow(QMainWindow):
         self.session_controller = CollageSessionController(
             adapter,
             history_limit=30,
+            max_history_bytes=config.UNDO_HISTORY_MAX_BYTES,
         )
 
     def _ensure_caption_snapshot(self) -> None:
@@ -402,16 +432,13 @@ class MainWindow(QMainWindow):
             return
 
     def _select_all(self):
-        for cell in self.collage.cells:
-            cell.selected = True
-            cell.update()
+        self.collage.set_all_selected(True)
 
     def _delete_selected(self):
         targets = [
             cell
-            for cell in self.collage.cells
-            if cell.selected
-            and (
+            for cell in self.collage.selected_cells()
+            if (
                 getattr(cell, "pixmap", None)
                 or getattr(cell, "caption", "")
                 or getattr(cell, "top_caption", "")
@@ -489,29 +516,38 @@ class MainWindow(QMainWindow):
             path = self._select_save_path(opts.format)
             if not path:
                 return
-            primary = self._render_scaled_image(opts.resolution)
-            primary.setText("Software", "Collage Maker")
             fmt = opts.format.lower()
-            if fmt in ("jpeg", "jpg"):
-                primary = self._ensure_image_format(primary, fmt)
+            # Widgets and pixmaps are only touched here on the GUI thread;
+            # resampling, composition and alpha flattening run in the worker.
+            native, out_size = self._render_export_source(opts.resolution)
+
+            def build_primary() -> QImage:
+                image = ImageOptimizer.resample(native, out_size)
+                image.setText("Software", "Collage Maker")
+                return self._ensure_image_format(image, fmt)
 
-            original_payload: tuple[str | None, QImage | None]
+            original_payload: tuple[str | None, Callable[[], QImage] | None]
             original_payload = (None, None)
             if opts.save_original:
-                composed = self._compose_original_image()
-                if composed is None:
+                layout = self._collect_original_tiles()
+                if layout is None:
                     QMessageBox.information(
                         self,
                         "No Original Images",
                         "There are no original images to export.",
                     )
                 else:
-                    if fmt in ("jpeg", "jpg"):
-                        composed = self._ensure_image_format(composed, fmt)
                     orig_path = os.path.splitext(path)[0] + f"_original.{fmt}"
-                    original_payload = (orig_path, composed)
+                    original_payload = (
+                        orig_path,
+                        lambda: self._ensure_image_format(
+                            self._compose_original_image(*layout), fmt
+                        ),
+                    )
 
-            self._run_export_worker(path, fmt, opts.quality, primary, original_payload)
+            self._run_export_worker(
+                path, fmt, opts.quality, build_primary, original_payload
+            )
         except Exception as e:
             logging.error("Save failed: %s", e)
             QMessageBox.critical(self, "Error", f"Could not save collage: {e}")
@@ -531,10 +567,7 @@ class MainWindow(QMainWindow):
         v = QVBoxLayout(dialog)
 
         preview = QLabel()
-        pix = self.collage.grab().scaled(
-            300, 300, Qt.KeepAspectRatio, Qt.SmoothTransformation
-        )
-        preview.setPixmap(pix)
+        preview.setPixmap(self._render_preview(300))
         v.addWidget(preview, alignment=Qt.AlignCenter)
 
         original = QCheckBox("Save Original at full resolution")
@@ -573,6 +606,41 @@ class MainWindow(QMainWindow):
             save_original=original.isChecked(),
         )
 
+    def _render_preview(self, max_side: int) -> QPixmap:
+        """Render the collage straight into a pixmap no larger than ``max_side``.
+
+        Painting at the preview scale avoids grabbing the whole widget into a
+        full-size backbuffer only to throw most of it away when shrinking.
+        """
+        base = self.collage.size()
+        if base.isEmpty():
+            return QPixmap()
+        factor = min(max_side / base.width(), max_side / base.height(), 1.0)
+        dpr = self.devicePixelRatioF() if hasattr(self, "devicePixelRatioF") else 1.0
+        dpr = max(1.0, float(dpr))
+        logical = QSize(
+            max(1, round(base.width() * factor)), max(1, round(base.height() * factor))
+        )
+        pix = QPixmap(logical * dpr)
+        pix.setDevicePixelRatio(dpr)
+        pix.fill(Qt.transparent)
+        p = self._export_painter
+        p.begin(pix)
+        try:
+            p.setRenderHints(
+                QPainter.Antialiasing
+                | QPainter.SmoothPixmapTransform
+                | QPainter.TextAntialiasing
+            )
+            p.scale(
+                logical.width() / base.width(), logical.height() / base.height()
+            )
+            self.collage.render(p, QPoint(0, 0), self.collage.rect())
+        finally:
+            if p.isActive():
+                p.end()
+        return pix
+
     def _select_save_path(self, fmt: str) -> "str | None":
         options = QFileDialog.Options()
         if sys.platform.startswith("win"):
@@ -627,8 +695,8 @@ class MainWindow(QMainWindow):
         path: str,
         fmt: str,
         quality: int,
-        primary: QImage,
-        original_payload: tuple[str | None, QImage | None],
+        build_primary: Callable[[], QImage],
+        original_payload: tuple[str | None, Callable[[], QImage] | None],
     ) -> None:
         dialog = QProgressDialog("Saving collage...", "", 0, 0, self)
         dialog.setWindowTitle("Saving")
@@ -637,14 +705,13 @@ class MainWindow(QMainWindow):
         dialog.setMinimumDuration(0)
         dialog.show()
 
-        orig_path, orig_image = original_payload
+        orig_path, build_original = original_payload
 
         def _write_files() -> tuple[str, str | None]:
-            uppercase_fmt = "JPEG" if fmt in {"jpeg", "jpg"} else fmt.upper()
-            if not primary.save(path, uppercase_fmt, quality):
+            if not self._write_image(build_primary(), path, fmt, quality):
                 raise IOError(f"Failed to save collage to {path}")
-            if orig_path and orig_image is not None:
-                if not orig_image.save(orig_path, uppercase_fmt, quality):
+            if orig_path and build_original is not None:
+                if not self._write_image(build_original(), orig_path, fmt, quality):
                     raise IOError(f"Failed to save original collage to {orig_path}")
             return path, orig_path
 
@@ -652,17 +719,16 @@ class MainWindow(QMainWindow):
 
         def _on_result(result: tuple[str, str | None]) -> None:
             saved_path, original_path = result
-            message = f"Saved: {saved_path}"
-            if original_path:
-                message = f"{message}\nOriginal: {original_path}"
             logging.info("Saved collage to %s", saved_path)
             if original_path:
                 logging.info("Saved original collage to %s", original_path)
-            QMessageBox.information(self, "Saved", message)
+            self.exportFinished.emit(
+                True, {"path": saved_path, "original": original_path}
+            )
 
         def _on_error(message: str) -> None:
             logging.error("Save failed: %s", message)
-            QMessageBox.critical(self, "Error", f"Could not save collage: {message}")
+            self.exportFinished.emit(False, {"error": message})
 
         def _on_finished() -> None:
             dialog.close()
@@ -671,17 +737,90 @@ class MainWindow(QMainWindow):
         worker.signals.error.connect(_on_error)
         worker.signals.finished.connect(_on_finished)
 
-        QThreadPool.globalInstance().start(worker)
+        # The task queue keeps the worker alive until its queued signals have
+        # been delivered; a bare pool start could drop the result callback.
+        get_task_queue().add_task(worker, priority=1)
 
-    def _render_scaled_image(self, resolution: int) -> QImage:
-        """Render the collage at a scaled resolution with DPI awareness and clamping.
+    def _notify_export_finished(self, succeeded: bool, details: dict) -> None:
+        """Report an export outcome to the user.
 
+        Kept out of the write path so the worker result returns as soon as
+        the files are on disk; batch flows can disconnect this slot.
+        """
+        if not succeeded:
+            QMessageBox.critical(
+                self, "Error", f"Could not save collage: {details.get('error')}"
+            )
+            return
+        message = f"Saved: {details.get('path')}"
+        if details.get("original"):
+            message = f"{message}\nOriginal: {details['original']}"
+        QMessageBox.information(self, "Saved", message)
+
+    @staticmethod
+    def _write_image(image: QImage, path: str, fmt: str, quality: int) -> bool:
+        """Encode ``image`` to ``path``; safe to call from a worker thread.
+
+        PNG goes straight from the pixel buffer to Pillow with a fast zlib
+        level derived from the quality slider (Qt's PNG writer is slower on
+        the DEFLATE pass). JPEG also goes through Pillow, whose
+        libjpeg-turbo build encodes about twice as fast as Qt's writer with
+        the same 4:2:0 output, DPI and text comment; other formats use
+        ``QImage.save``.
+        """
+        dpi = (image.dotsPerMeterX() * 0.0254, image.dotsPerMeterY() * 0.0254)
+        if fmt == "png":
+            pnginfo = PngInfo()
+            for key in image.textKeys():
+                pnginfo.add_text(key, image.text(key))
+            compress_level = max(1, min(9, round((100 - quality) * 9 / 100)))
+            try:
+                ImageOptimizer.to_pil(image).save(
+                    path,
+                    "PNG",
+                    compress_level=compress_level,
+                    optimize=False,
+                    pnginfo=pnginfo,
+                    dpi=dpi,
+                )
+            except OSError as exc:
+                logging.error("PNG encode failed for %s: %s", path, exc)
+                return False
+            return True
+        if fmt in {"jpeg", "jpg"}:
+            # Same "key: value" comment Qt's JPEG writer emits for text keys.
+            comment = "\n".join(
+                f"{key}: {image.text(key)}" for key in image.textKeys()
+            )
+            try:
+                ImageOptimizer.to_pil(image, drop_alpha=True).save(
+                    path,
+                    "JPEG",
+                    quality=quality,
+                    subsampling=2,
+                    dpi=dpi,
+                    **({"comment": comment} if comment else {}),
+                )
+            except OSError as exc:
+                logging.error("JPEG encode failed for %s: %s", path, exc)
+                return False
+            return True
+        return image.save(path, fmt.upper(), quality)
+
+    def _render_export_source(self, resolution: int) -> tuple[QImage, QSize]:
+        """Paint the collage for export and return it with its output size.
+
+        - Paints the collage once at its native device-pixel size.
         - Multiplies logical size by ``resolution`` and device pixel ratio.
         - Clamps the largest side to ``config.MAX_EXPORT_DIMENSION`` to avoid excessive memory usage.
+        - Leaves the single ``ImageOptimizer.resample`` pass to the output
+          size (Lanczos up, box down by default) to the caller, which runs it
+          off the GUI thread.
         """
         base = self.collage.size()
         dpr = self.devicePixelRatioF() if hasattr(self, "devicePixelRatioF") else 1.0
-        scale = max(1.0, float(resolution) * float(dpr))
+        dpr = max(1.0, float(dpr))
+        scale = max(1.0, float(resolution) * dpr)
         out_w = int(base.width() * scale)
         out_h = int(base.height() * scale)
         # Clamp to max export dimension
@@ -692,19 +831,25 @@ class MainWindow(QMainWindow):
             out_h = max(1, int(out_h * factor))
 
         # Use QImage for deterministic pixel buffer
-        img = QImage(out_w, out_h, QImage.Format_ARGB32)
+        native_w = max(1, int(base.width() * dpr))
+        native_h = max(1, int(base.height() * dpr))
+        img = QImage(native_w, native_h, QImage.Format_ARGB32_Premultiplied)
         img.fill(Qt.transparent)
-        p = QPainter(img)
-        p.setRenderHints(
-            QPainter.Antialiasing
-            | QPainter.SmoothPixmapTransform
-            | QPainter.TextAntialiasing
-        )
-        # Render from logical coordinates scaled to pixel buffer size
-        p.scale(out_w / base.width(), out_h / base.height())
-        self.collage.render(p)
-        p.end()
-        return img
+        p = self._export_painter
+        p.begin(img)
+        try:
+            p.setRenderHints(
+                QPainter.Antialiasing
+                | QPainter.SmoothPixmapTransform
+                | QPainter.TextAntialiasing
+            )
+            # Render from logical coordinates into device pixels
+            p.scale(native_w / base.width(), native_h / base.height())
+            self.collage.render(p, QPoint(0, 0), self.collage.rect())
+        finally:
+            if p.isActive():
+                p.end()
+        return img, QSize(out_w, out_h)
 
     def _validate_selected_images(
         self, selections: Sequence[str]
@@ -764,24 +909,76 @@ class MainWindow(QMainWindow):
             return
 
         captured = self._capture_for_undo()
-        assigned = 0
         attempted = min(len(valid_paths), len(empty_cells))
+        state = {"assigned": 0, "pending": 0}
+        targets = []
         for path, cell in zip(valid_paths, empty_cells):
-            try:
-                reader = QImageReader(str(path))
-                reader.setAutoTransform(True)
-                img = reader.read()
-                if img.isNull():
-                    logging.warning("Skipping invalid image: %s", path)
-                    continue
-                # Optimize for current cell size
-                optimized = ImageOptimizer.optimize_image(img, cell.size())
-                display_pix = QPixmap.fromImage(optimized)
-                original_pix = QPixmap.fromImage(img)
-                cell.setImage(display_pix, original=original_pix)
-                assigned += 1
-            except Exception as e:
-                logging.warning("Failed to add image %s: %s", path, e)
+            # Files already decoded for a cell of this size skip the decode.
+            if cell.load_cached(str(path)):
+                state["assigned"] += 1
+            else:
+                targets.append((path, cell))
+
+        def _finish() -> None:
+            self._finish_add_images(
+                captured,
+                state["assigned"],
+                attempted,
+                len(valid_paths),
+                len(empty_cells),
+                validation_errors,
+            )
+
+        def _queue_decode(path: Path, cell) -> None:
+            # Decode and scale on the shared image queue; only the QPixmap
+            # conversion and cell assignment run on the GUI thread.
+            worker = Worker(self._decode_for_cell, path, cell.size())
+
+            def _on_result(images) -> None:
+                # The cell may have been deleted or filled (drop, swap) while
+                # the decode was in flight.
+                if images is None or not isValid(cell) or cell.pixmap:
+                    return
+                optimized, img, metadata = images
+                try:
+                    display_pix = QPixmap.fromImage(optimized)
+                    if img is None:
+                        original_pix = None  # decoded at display size only
+                    elif img is optimized:
+                        original_pix = display_pix  # source already fits the cell
+                    else:
+                        original_pix = QPixmap.fromImage(img)
+                    cell.remember_image(str(path), display_pix, original_pix, metadata)
+                    state["assigned"] += 1
+                except Exception as e:
+                    logging.warning("Failed to add image %s: %s", path, e)
+
+            def _on_finished() -> None:
+                state["pending"] -= 1
+                if state["pending"] == 0:
+                    _finish()
+
+            worker.signals.result.connect(_on_result)
+            worker.signals.finished.connect(_on_finished)
+            get_task_queue().add_task(worker)
+
+        if not targets:
+            _finish()
+            return
+        state["pending"] = len(targets)
+        for path, cell in targets:
+            _queue_decode(path, cell)
+
+    def _finish_add_images(
+        self,
+        captured: bool,
+        assigned: int,
+        attempted: int,
+        selected: int,
+        empty: int,
+        validation_errors: Sequence[str],
+    ) -> None:
+        """Settle the undo capture and report skips once a batch has landed."""
         if assigned == 0 and captured:
             self._discard_latest_snapshot()
         elif captured and assigned > 0:
@@ -791,10 +988,10 @@ class MainWindow(QMainWindow):
             issues.append(
                 f"{attempted - assigned} file(s) could not be decoded and were skipped."
             )
-        remaining_capacity = len(valid_paths) - attempted
+        remaining_capacity = selected - attempted
         if remaining_capacity > 0:
             issues.append(
-                f"Only {len(empty_cells)} empty cell(s) were available; {remaining_capacity}"
+                f"Only {empty} empty cell(s) were available; {remaining_capacity}"
                 " selection(s) were not placed."
             )
         if validation_errors:
@@ -809,15 +1006,60 @@ class MainWindow(QMainWindow):
                 "\n\n".join(issues),
             )
 
+    @staticmethod
+    def _decode_for_cell(
+        path: Path, target: QSize
+    ) -> Optional[tuple[QImage, Optional[QImage], Optional[dict]]]:
+        """Decode ``path`` and build its display copy; safe to call off the GUI thread.
+
+        Sources far larger than the cell are decoded at display size only and
+        the original is left to the cell's background decode (``None``).
+        """
+        try:
+            reader = QImageReader(str(path))
+            reader.setAutoTransform(True)
+            try:
+                metadata = ImageOptimizer.metadata_from_reader(reader, str(path))
+            except Exception as e:
+                logging.warning("Failed to read metadata for %s: %s", path, e)
+                metadata = None
+            # Same policy as the cell loader: decode at display size when the
+            # source dwarfs the cell, otherwise cap at MAX_IMAGE_DIMENSION
+            # (JPEG uses IDCT scaling for both).
+            display_decode = ImageOptimizer.scaled_decode_size(reader.size(), target)
+            if display_decode is not None:
+                img = ImageOptimizer.read_display_decode(reader, str(path), display_decode)
+            else:
+                decode_size = ImageOptimizer.capped_decode_size(reader.size())
+                if decode_size is not None:
+                    reader.setScaledSize(decode_size)
+                img = reader.read()
+            if img.isNull():
+                logging.warning("Skipping invalid image: %s", path)
+                return None
+            ImageOptimizer.prepare_for_paint(img)
+            # Optimize for current cell size
+            optimized = ImageOptimizer.optimize_image(img, target)
+            return optimized, None if display_decode else img, metadata
+        except Exception as e:
+            logging.warning("Failed to add image %s: %s", path, e)
+            return None
+
     def _ensure_image_format(self, image: QImage, fmt: str) -> QImage:
-        if fmt in ("jpeg", "jpg") and image.hasAlphaChannel():
-            return image.convertToFormat(QImage.Format_RGB32)
+        if fmt in ("jpeg", "jpg"):
+            return ImageOptimizer.flatten_alpha(image)
         return image
 
-    def _compose_original_image(self) -> QImage | None:
-        # Compute full-original grid size
-        total_w = 0
-        total_h = 0
+    def _collect_original_tiles(
+        self,
+    ) -> "tuple[QSize, list[tuple[QPoint, QImage]]] | None":
+        """Lay out the cells' originals on a full-resolution grid.
+
+        Returns the canvas size and each original's image with its offset,
+        or ``None`` when no cell has an original.  Reads pixmaps, so it must
+        run on the GUI thread; :meth:`_compose_original_image` does the
+        painting and is safe to call from a worker.
+        """
         # widths and heights by column/row
         col_widths = [0] * self.collage.columns
         row_heights = [0] * self.collage.rows
@@ -835,24 +1077,37 @@ class MainWindow(QMainWindow):
         if total_w <= 0 or total_h <= 0:
             return None
 
-        canvas = QImage(total_w, total_h, QImage.Format_ARGB32)
-        canvas.fill(Qt.transparent)
-        painter = QPainter()
-        painter.begin(canvas)
-        painter.setRenderHint(QPainter.SmoothPixmapTransform)
-
+        tiles: list[tuple[QPoint, QImage]] = []
         y_offset = 0
         for r in range(self.collage.rows):
             x_offset = 0
             for c in range(self.collage.columns):
                 cell = self.collage.get_cell_at(r, c)
                 if cell and cell.original_pixmap:
-                    painter.drawImage(
-                        QPoint(x_offset, y_offset), cell.original_pixmap.toImage()
+                    tiles.append(
+                        (QPoint(x_offset, y_offset), cell.original_pixmap.toImage())
                     )
                 x_offset += col_widths[c]
             y_offset += row_heights[r]
-        painter.end()
+        return QSize(total_w, total_h), tiles
+
+    @staticmethod
+    def _compose_original_image(
+        size: QSize, tiles: "list[tuple[QPoint, QImage]]"
+    ) -> QImage:
+        # Premultiplied so the JPEG flatten can blend it without converting
+        # first. Tiles never overlap and the canvas starts transparent, so
+        # Source composition is a plain copy instead of a read-modify-write.
+        canvas = QImage(size, QImage.Format_ARGB32_Premultiplied)
+        canvas.fill(Qt.transparent)
+        painter = QPainter(canvas)
+        try:
+            painter.setRenderHint(QPainter.SmoothPixmapTransform)
+            painter.setCompositionMode(QPainter.CompositionMode_Source)
+            for offset, image in tiles:
+                painter.drawImage(offset, image)
+        finally:
+            painter.end()
         return canvas
 
     def get_collage_state(self):
@@ -869,5 +1124,7 @@ if __name__ == "__main__":
     theme = os.environ.get("COLLAGE_THEME", "light")
     style_tokens.apply_tokens(app, theme=theme)
     window = MainWindow()
+    # Long-lived startup objects (modules, widgets) never need rescanning.
+    gc.freeze()
     window.show()
     sys.exit(app.exec())
@@ -12,7 +12,6 @@ as observed durations.
 
 from __future__ import annotations
 
-import glob
 import json
 import logging
 import os
@@ -33,6 +32,12 @@ from PySide6.QtCore import (
     Signal,
 )
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 from .. import config
 
 
@@ -56,6 +61,14 @@ class _AutosaveMetrics:
 autosave_metrics = _AutosaveMetrics()
 
 
+def _dump_state(state: dict) -> bytes:
+    """Serialize *state* to compact UTF-8 JSON, preferring orjson when installed."""
+
+    if HAS_ORJSON:
+        return orjson.dumps(state)
+    return json.dumps(state, separators=(",", ":")).encode("utf-8")
+
+
 @dataclass(slots=True)
 class _AutosaveContext:
     """Holds state shared across autosave attempts."""
@@ -121,6 +134,10 @@ class AutosaveManager:
         self._retry_scheduler = retry_scheduler or (
             lambda ms, cb: QTimer.singleShot(ms, cb)
         )
+        # Snapshot most recently persisted; an identical snapshot is not rewritten.
+        self._last_state: Optional[dict] = None
+        # Snapshots written since the last fsync.
+        self._unsynced_writes = 0
 
     def wait_for_idle(self, timeout: float | None = None) -> None:
         """Block until the current autosave (if any) completes.
@@ -174,9 +191,39 @@ class AutosaveManager:
             self._finalize_failure(context, attempt, str(exc), terminal=True)
             raise AutosaveError(f"Failed to autosave to {context.path}") from exc
 
+        # Cells hand back their cached base64 payload objects, so comparing
+        # against the last written snapshot short-circuits on identity for
+        # the bulky image strings and costs far less than encode + write.
+        if state == self._last_state:
+            autosave_metrics.record("skipped")
+            context.log.debug("autosave skipped; state unchanged")
+            self._is_running = False
+            self._idle_event.set()
+            return
+
+        # Waiting on the disk is what stalls a tick, so only every
+        # AUTOSAVE_FSYNC_EVERY-th snapshot is synced; cleanup keeps enough
+        # older snapshots that one of them always is.
+        sync = self._unsynced_writes + 1 >= config.AUTOSAVE_FSYNC_EVERY
+
         def _write_payload() -> str:
-            with open(context.path, "w", encoding="utf-8") as handle:
-                json.dump(state, handle)
+            data = _dump_state(state)
+            # Write beside the target and swap it in, so a crash mid-write
+            # never leaves a truncated autosave under the final name.
+            tmp_path = f"{context.path}.tmp"
+            try:
+                # Unbuffered, so the encoded blob goes out in one write().
+                with open(tmp_path, "wb", buffering=0) as handle:
+                    handle.write(data)
+                    if sync:
+                        os.fsync(handle.fileno())
+                os.replace(tmp_path, context.path)
+            except OSError:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+                raise
             return context.path
 
         worker = _AutosaveWorker(_write_payload)
@@ -188,6 +235,8 @@ class AutosaveManager:
                 "autosave complete",
                 extra={"path": context.path, "duration_ms": duration},
             )
+            self._last_state = state
+            self._unsynced_writes = 0 if sync else self._unsynced_writes + 1
             self._cleanup_old(context.log)
             self._pending_exception = None
 
@@ -212,9 +261,29 @@ class AutosaveManager:
             self._idle_event.set()
 
 
+    def _list_autosaves(self) -> list[str]:
+        """Return autosave paths newest first.
+
+        File names embed ``AUTOSAVE_TIMESTAMP_FORMAT`` (``yyyyMMdd_HHmmss``), so
+        a reverse name sort orders them by age with a single directory read
+        and no per-file ``stat`` calls.
+        """
+        try:
+            with os.scandir(self.path) as entries:
+                names = [
+                    entry.name
+                    for entry in entries
+                    if entry.name.startswith("collage_autosave_")
+                    and entry.name.endswith(".json")
+                    and entry.is_file()
+                ]
+        except OSError:
+            return []
+        names.sort(reverse=True)
+        return [os.path.join(self.path, name) for name in names]
+
     def _cleanup_old(self, log: Optional[logging.LoggerAdapter] = None) -> None:
-        pattern = os.path.join(self.path, "collage_autosave_*.json")
-        files = sorted(glob.glob(pattern), key=os.path.getctime, reverse=True)
+        files = self._list_autosaves()
         for old in files[config.MAX_AUTOSAVE_FILES:]:
             try:
                 os.remove(old)
@@ -225,11 +294,8 @@ class AutosaveManager:
                 )
 
     def get_latest(self) -> Optional[str]:
-        pattern = os.path.join(self.path, "collage_autosave_*.json")
-        files = glob.glob(pattern)
-        if not files:
-            return None
-        return max(files, key=os.path.getctime)
+        files = self._list_autosaves()
+        return files[0] if files else None
 
     def _handle_worker_error(
         self,
@@ -48,7 +48,10 @@ class AutosaveEncodingManager:
         """Encode ``image`` asynchronously and forward the payload to ``callback``."""
         with self._lock:
             self._pending[token] = True
-        worker = Worker(_encode_image, image.copy())
+        # QImage is implicitly shared with an atomic refcount: the worker only
+        # reads it, and any later write on the GUI side detaches there, so a
+        # defensive deep copy would just duplicate the whole pixel buffer.
+        worker = Worker(_encode_image, image)
 
         def _handle_result(payload: Optional[str], *, expected: AutosaveToken = token) -> None:
             self._finish(expected)
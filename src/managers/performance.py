@@ -4,8 +4,10 @@ PerformanceMonitor: checks memory usage and triggers cleanup when thresholds exc
 """
 import gc
 import logging
+import time
+from typing import Callable, Set
 
-from PySide6.QtCore import QTimer, QDateTime
+from PySide6.QtCore import QTimer, QThreadPool
 
 try:
     import psutil
@@ -14,39 +16,81 @@ except ImportError:
     HAS_PSUTIL = False
 
 from .. import config
-from ..cache import get_cache
+from ..cache import get_cache, get_mipmap_cache, get_scaled_pixmap_cache
+from ..workers import Worker
 
 
 class PerformanceMonitor:
-    """Monitors memory usage and performs cleanup actions."""
+    """Monitors memory usage and performs cleanup actions.
+
+    RSS sampling runs on a dedicated single-thread pool so the GUI thread
+    never blocks on the syscall; cleanup itself stays on the GUI thread
+    because it touches widgets.
+    """
     def __init__(self, parent):
         self.parent = parent
+        self._process = psutil.Process() if HAS_PSUTIL else None
+        self._pool = QThreadPool(parent)
+        self._pool.setMaxThreadCount(1)
+        # Holding each worker keeps its signal object alive until delivery.
+        self._samples: Set[Worker] = set()
         self.timer = QTimer(parent)
         self.timer.timeout.connect(self.check_memory)
         self.timer.start(config.MEMORY_CLEANUP_INTERVAL_SECS * 1000)
-        self.last_cleanup = QDateTime.currentDateTime()
+        # Monotonic seconds: immune to wall-clock changes and no Qt objects.
+        self.last_cleanup = time.monotonic()
 
     def check_memory(self) -> None:
-        if not HAS_PSUTIL:
+        if self._process is None or self._samples:
             return
+        self._sample(self._on_memory_sample)
+
+    def _sample(self, on_result: Callable[[int], None]) -> None:
+        """Read RSS on the monitor pool and deliver it to ``on_result``."""
+        worker = Worker(self._memory_usage)
+        worker.signals.result.connect(on_result)
+        worker.signals.finished.connect(lambda: self._samples.discard(worker))
+        self._samples.add(worker)
+        self._pool.start(worker)
+
+    def _memory_usage(self) -> int:
+        """Return the current RSS in bytes, or 0 when it cannot be read."""
+        if self._process is None:
+            return 0
         try:
-            proc = psutil.Process()
-            mem = proc.memory_info().rss
-            if mem > config.MEMORY_THRESHOLD_BYTES:
-                now = QDateTime.currentDateTime()
-                if self.last_cleanup.secsTo(now) >= config.MEMORY_CLEANUP_INTERVAL_SECS:
-                    self._optimize()
-                    self.last_cleanup = now
+            return self._process.memory_info().rss
         except Exception as e:
             logging.warning("Memory check failed: %s", e)
+            return 0
+
+    def _on_memory_sample(self, mem: int) -> None:
+        if mem > config.MEMORY_THRESHOLD_BYTES:
+            now = time.monotonic()
+            if now - self.last_cleanup >= config.MEMORY_CLEANUP_INTERVAL_SECS:
+                self._optimize()
+                self.last_cleanup = now
+
+    def _on_cleanup_sample(self, mem: int) -> None:
+        if mem > config.MEMORY_THRESHOLD_BYTES:
+            gc.collect()
 
     def _optimize(self) -> None:
         get_cache().cleanup()
+        get_scaled_pixmap_cache().clear()
+        get_mipmap_cache().clear()
+        history = getattr(self.parent, "session_controller", None)
+        if history is not None:
+            history.trim_history(config.UNDO_HISTORY_PRESSURE_BYTES)
         # Attempt to optimize grid cells if accessible
         if hasattr(self.parent, "collage") and hasattr(self.parent.collage, "optimize_memory"):
             self.parent.collage.optimize_memory()
         elif hasattr(self.parent, "optimize_memory"):
-             self.parent.optimize_memory()
-            
-        gc.collect()
+            self.parent.optimize_memory()
+
+        # Released pixmap wrappers sit in the young generations; only pay for
+        # a full collection when a fresh off-thread sample says that was not
+        # enough.
+        gc.collect(1)
+        if self._process is not None:
+            self._sample(self._on_cleanup_sample)
         logging.info("PerformanceMonitor: memory optimization executed")
@@ -5,7 +5,7 @@ ErrorRecoveryManager: tracks error frequency and performs recovery actions when
 import os
 import json
 import logging
-import traceback
+import time
 
 from PySide6.QtCore import QDateTime
 from PySide6.QtWidgets import QMessageBox
@@ -20,15 +20,18 @@ class ErrorRecoveryManager:
         self.save_state = save_state
         self.reset_callback = reset_callback
         self.error_count = 0
-        self.last_error_time = QDateTime.currentDateTime()
+        self.last_error_time = time.monotonic()
 
     def handle_error(self, error: Exception, context: str) -> None:
-        now = QDateTime.currentDateTime()
-        if self.last_error_time.secsTo(now) > config.ERROR_WINDOW_SECONDS:
+        now = time.monotonic()
+        if now - self.last_error_time > config.ERROR_WINDOW_SECONDS:
             self.error_count = 0
         self.error_count += 1
         self.last_error_time = now
-        logging.error("Error in %s: %s", context, traceback.format_exc())
+        # The traceback is attached, not pre-formatted: logging renders it
+        # only if a handler emits the record, and it is the traceback of
+        # ``error`` rather than of whatever exception is currently active.
+        logging.error("Error in %s: %s", context, error, exc_info=error)
 
         if self.error_count >= config.ERROR_THRESHOLD:
             self._recover()
@@ -4,12 +4,32 @@ Image optimization utilities for Collage Maker.
 Provides functions to scale images for display and extract metadata safely.
 """
 
-from typing import Dict
-from PySide6.QtCore import Qt, QSize, QFileInfo
-from PySide6.QtGui import QImage, QImageReader
+import os
+import sys
+from typing import Dict, Optional
+from PIL import Image
+from PySide6.QtCore import Qt, QSize
+from PySide6.QtGui import QImage, QImageReader, QPainter
 
 from . import config
+from .cache import get_thumbnail_cache
 
+# Pillow filters selectable via config.EXPORT_*_FILTER
+_RESAMPLE_FILTERS = {
+    "nearest": Image.Resampling.NEAREST,
+    "box": Image.Resampling.BOX,
+    "bilinear": Image.Resampling.BILINEAR,
+    "bicubic": Image.Resampling.BICUBIC,
+    "lanczos": Image.Resampling.LANCZOS,
+}
+
+# Formats QPainter draws without a per-pixel conversion
+_PAINT_READY_FORMATS = frozenset({
+    QImage.Format_RGB32,
+    QImage.Format_ARGB32_Premultiplied,
+    QImage.Format_RGBX8888,
+    QImage.Format_RGBA8888_Premultiplied,
+})
 
 class ImageOptimizer:
     """Handles image optimization and metadata extraction."""
@@ -17,12 +37,16 @@ class ImageOptimizer:
     @staticmethod
     def optimize_image(image: QImage, target_size: QSize) -> QImage:
         """
-        Scale the image to fit within target_size while maintaining aspect ratio.
-        Enforces a maximum display dimension from config.
+        Scale the image down to fit within target_size, keeping aspect ratio.
+        Enforces a maximum display dimension from config. Images that already
+        fit are returned as-is so the display copy shares the original's
+        pixels; cells upscale at paint time through the scaled-pixmap cache.
         """
-        # Convert to optimal format if needed
-        if image.format() != QImage.Format_ARGB32:
-            image = image.convertToFormat(QImage.Format_ARGB32)
+        # Premultiplied alpha is Qt's fast path for QPainter compositing;
+        # straight ARGB32 forces a per-pixel divide on every draw. Opaque
+        # formats (e.g. RGB32 JPEGs) already paint fast and are kept as-is.
+        if image.format() not in _PAINT_READY_FORMATS:
+            image = image.convertToFormat(QImage.Format_ARGB32_Premultiplied)
 
         # Determine scaling factor based on max display dimension
         max_dim = max(target_size.width(), target_size.height())
@@ -35,8 +59,10 @@ class ImageOptimizer:
         else:
             scaled_target = target_size
 
-        # Perform scaling if needed
-        if image.size() != scaled_target:
+        # Perform scaling if needed. Qt's smooth scaler is multi-threaded and
+        # area-averaging; it outpaces a Pillow round trip (copy in, resize,
+        # copy out) by several times for display downscales, so it stays.
+        if image.width() > scaled_target.width() or image.height() > scaled_target.height():
             # Use positional args for PySide6 compatibility
             image = image.scaled(
                 scaled_target,
@@ -46,26 +72,256 @@ class ImageOptimizer:
 
         return image
 
+    @staticmethod
+    def prepare_for_paint(image: QImage) -> None:
+        """
+        Convert a freshly decoded image to a paint-ready format in place.
+        Alpha images become ARGB32_Premultiplied and opaque ones RGB32; Qt
+        reuses the pixel buffer when the depth matches, so no second copy is
+        allocated. Raster QPixmaps store alpha premultiplied anyway, so this
+        loses nothing for images that end up as pixmaps.
+        """
+        if image.format() in _PAINT_READY_FORMATS:
+            return
+        image.convertTo(
+            QImage.Format_ARGB32_Premultiplied
+            if image.hasAlphaChannel()
+            else QImage.Format_RGB32
+        )
+
+    @staticmethod
+    def flatten_alpha(image: QImage, background=Qt.white) -> QImage:
+        """
+        Composite ``image`` over an opaque ``background`` for alpha-less formats.
+        Returns an RGB32 image with the source's DPI and text metadata.
+        Images without an alpha channel are returned unchanged.
+        """
+        if not image.hasAlphaChannel():
+            return image
+        # Premultiplied sources take Qt's vectorized SourceOver blend; a
+        # plain RGB32 conversion would instead leave transparent areas black.
+        if image.format() not in _PAINT_READY_FORMATS:
+            image = image.convertToFormat(QImage.Format_ARGB32_Premultiplied)
+        flat = QImage(image.size(), QImage.Format_RGB32)
+        flat.fill(background)
+        flat.setDotsPerMeterX(image.dotsPerMeterX())
+        flat.setDotsPerMeterY(image.dotsPerMeterY())
+        for key in image.textKeys():
+            flat.setText(key, image.text(key))
+        painter = QPainter(flat)
+        painter.drawImage(0, 0, image)
+        painter.end()
+        return flat
+
+    @staticmethod
+    def scaled_decode_size(source: QSize, display: QSize) -> Optional[QSize]:
+        """
+        Return a reduced decode size for display-only loads, or None to decode in full.
+        When the source exceeds the display by config.DECODE_DOWNSCALE_THRESHOLD,
+        decode at config.DECODE_OVERSAMPLE times the display size (aspect preserved)
+        so QImageReader can use the codec's scaled decode (e.g. JPEG IDCT scaling).
+        """
+        if not source.isValid() or source.isEmpty() or display.isEmpty():
+            return None
+        threshold = config.DECODE_DOWNSCALE_THRESHOLD
+        if (
+            source.width() <= display.width() * threshold
+            and source.height() <= display.height() * threshold
+        ):
+            return None
+        bound = display * config.DECODE_OVERSAMPLE
+        return source.scaled(bound, Qt.KeepAspectRatio)
+
+    @staticmethod
+    def read_display_decode(reader: QImageReader, file_path: str, size: QSize) -> QImage:
+        """
+        Read *reader* scaled to the display decode *size*, going through the
+        on-disk thumbnail cache so a source seen in an earlier session is
+        not decoded again. A null image means the read failed.
+        JPEG sources bypass the cache: their IDCT-scaled decode already
+        costs about as much as reading a stored thumbnail back. Misses are
+        written after the decode returns, on the cache's own thread.
+        """
+        thumbnails = None
+        if bytes(reader.format()).lower() not in (b"jpeg", b"jpg"):
+            thumbnails = get_thumbnail_cache()
+        if thumbnails is not None:
+            cached = thumbnails.load(file_path, size)
+            if cached is not None:
+                return cached
+        reader.setScaledSize(size)
+        img = reader.read()
+        if thumbnails is not None and not img.isNull():
+            # Converted before it is shared with the writer, so the caller's
+            # own prepare_for_paint is a no-op instead of a detaching copy.
+            ImageOptimizer.prepare_for_paint(img)
+            thumbnails.store_later(file_path, size, img)
+        return img
+
+    @staticmethod
+    def capped_decode_size(source: QSize) -> Optional[QSize]:
+        """
+        Return the decode size that keeps a full-quality load within
+        config.MAX_IMAGE_DIMENSION, or None when the source already fits.
+        """
+        max_dim = max(source.width(), source.height())
+        if max_dim <= config.MAX_IMAGE_DIMENSION:
+            return None
+        scale = config.MAX_IMAGE_DIMENSION / max_dim
+        return QSize(int(source.width() * scale), int(source.height() * scale))
+
+    @staticmethod
+    def build_mipmaps(source, min_side: Optional[int] = None) -> list:
+        """
+        Return ``[source, source/2, source/4, ...]`` for a QImage or QPixmap.
+        Each level is a smooth 2x reduction of the previous one, stopping
+        before the shorter side would drop below ``min_side``
+        (config.MIPMAP_MIN_SIDE by default). The extra levels cost a third
+        of the source's memory.
+        """
+        min_side = config.MIPMAP_MIN_SIDE if min_side is None else min_side
+        levels = [source]
+        size = source.size()
+        while min(size.width(), size.height()) // 2 >= min_side:
+            size = QSize(size.width() // 2, size.height() // 2)
+            levels.append(
+                levels[-1].scaled(size, Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+            )
+        return levels
+
+    @staticmethod
+    def pick_mipmap(levels: list, target: QSize):
+        """
+        Return the smallest level of ``levels`` covering ``target`` in both
+        dimensions, so the final smooth scale shrinks by less than 2x.
+        Falls back to the full-size level when even that is smaller.
+        """
+        for level in reversed(levels):
+            if level.width() >= target.width() and level.height() >= target.height():
+                return level
+        return levels[0]
+
+    @staticmethod
+    def resample(image: QImage, target_size: QSize) -> QImage:
+        """
+        Resize the image to exactly target_size in a single Pillow pass.
+        Upscales use config.EXPORT_UPSCALE_FILTER, downscales use
+        config.EXPORT_DOWNSCALE_FILTER.
+        """
+        width, height = target_size.width(), target_size.height()
+        if image.isNull() or width <= 0 or height <= 0 or image.size() == target_size:
+            return image
+
+        upscale = width * height > image.width() * image.height()
+        name = config.EXPORT_UPSCALE_FILTER if upscale else config.EXPORT_DOWNSCALE_FILTER
+        resample_filter = _RESAMPLE_FILTERS.get(name.lower(), Image.Resampling.LANCZOS)
+
+        # Resample in premultiplied space (no colour halos at alpha edges) and
+        # let Pillow's C unpremultiply produce the straight alpha encoders need,
+        # instead of Qt's per-pixel divide at save time.
+        source = ImageOptimizer.to_pil(image, premultiplied=True)
+        resized = source.resize((width, height), resample_filter).convert("RGBA")
+        return ImageOptimizer.from_pil(resized)
+
+    @staticmethod
+    def to_pil(
+        image: QImage,
+        *,
+        premultiplied: bool = False,
+        drop_alpha: bool = False,
+    ) -> Image.Image:
+        """
+        Copy a QImage into a Pillow image with one buffer copy.
+        Uses Qt's byte-ordered RGBA8888 layout so no per-pixel swizzle is
+        needed; the source stride is honoured to respect Qt's row alignment.
+
+        Premultiplied sources are decoded by Pillow straight from Qt's bits.
+        ``drop_alpha`` yields an RGB image (Qt's RGBX8888 padding byte is
+        skipped by Pillow's unpacker) for encoders without alpha support.
+        """
+        if drop_alpha:
+            qt_format, mode, rawmode = QImage.Format_RGBX8888, "RGB", "RGBX"
+        elif premultiplied:
+            qt_format, mode, rawmode = (
+                QImage.Format_RGBA8888_Premultiplied, "RGBa", "RGBa"
+            )
+        else:
+            qt_format, mode, rawmode = QImage.Format_RGBA8888, "RGBA", "RGBA"
+        rgba = image.convertToFormat(qt_format)
+        bits = rgba.constBits()
+        if drop_alpha or premultiplied:
+            # Pillow unpacks RGBX/RGBa into its own storage, so no staging
+            # copy; frombytes because frombuffer would map RGBX as-is.
+            return Image.frombytes(
+                mode,
+                (rgba.width(), rgba.height()),
+                bits,
+                "raw",
+                rawmode,
+                rgba.bytesPerLine(),
+                1,
+            )
+        return Image.frombuffer(
+            mode,
+            (rgba.width(), rgba.height()),
+            bytes(bits),
+            "raw",
+            rawmode,
+            rgba.bytesPerLine(),
+            1,
+        )
+
+    @staticmethod
+    def from_pil(image: Image.Image) -> QImage:
+        """
+        Copy a Pillow image into a QImage (Format_RGBA8888) with one buffer copy.
+        """
+        if image.mode != "RGBA":
+            image = image.convert("RGBA")
+        width, height = image.size
+        data = image.tobytes()
+        # copy() detaches the QImage from the Python-owned buffer
+        return QImage(data, width, height, width * 4, QImage.Format_RGBA8888).copy()
+
     @staticmethod
     def process_metadata(file_path: str) -> Dict:
         """
         Extract metadata from an image file: size, format, bit depth, support status, and timestamp.
+        Only the file header is parsed; pixel data is never decoded.
         """
         reader = QImageReader(file_path)
         supported = reader.canRead()
         if not supported:
             raise IOError(f"Unsupported image format or cannot read file: {file_path}")
+        return ImageOptimizer.metadata_from_reader(reader, file_path)
 
-        fmt = reader.format().data().decode('utf-8') if reader.format().data() else ''
-        image = reader.read()
-        depth = image.depth() if image and not image.isNull() else None
+    @staticmethod
+    def metadata_from_reader(reader: QImageReader, file_path: str) -> Dict:
+        """
+        Build the metadata dict from a reader that is already open on file_path.
+        Call before reader.read() so decode workers can reuse their own reader
+        instead of reopening the file; format names are interned because the
+        same few strings repeat across every file in a batch.
+        """
+        raw_fmt = reader.format().data()
+        fmt = sys.intern(raw_fmt.decode('utf-8')) if raw_fmt else ''
+        image_format = reader.imageFormat()
+        depth = (
+            QImage.toPixelFormat(image_format).bitsPerPixel()
+            if image_format != QImage.Format_Invalid
+            else None
+        )
         size = reader.size()
-        timestamp = QFileInfo(file_path).lastModified()
+        # Plain mtime seconds: one stat, no QFileInfo/QDateTime objects.
+        try:
+            timestamp = os.stat(file_path).st_mtime
+        except OSError:
+            timestamp = None
 
         return {
             'size': size,
             'format': fmt,
             'depth': depth,
-            'supported': supported,
+            'supported': True,
             'timestamp': timestamp
         }
@@ -2,49 +2,125 @@
 """
 Defines the CollageCell widget and ImageMimeData for drag-and-drop.
 """
+from functools import lru_cache
 from typing import Optional
 import os
-import gc
 import logging
 
 from PySide6.QtWidgets import QWidget, QInputDialog, QDialog, QDialogButtonBox, QVBoxLayout, QLabel, QTextEdit
 from PySide6.QtCore import (
-    Qt, QMimeData, QByteArray, QDataStream, QIODevice, QRect, QSize, QPoint
+    Qt, QMimeData, QByteArray, QDataStream, QIODevice, QRect, QPoint, QSize
 )
 from PySide6.QtGui import (
     QPainter, QPixmap, QImageReader, QColor, QDrag, QAction, QImage,
     QFont, QFontMetrics, QPainterPath, QPen
 )
 from PySide6.QtWidgets import QMenu
-from PySide6.QtCore import QBuffer, QByteArray
+from shiboken6 import isValid
 
 from .. import config
-from ..cache import get_cache
+from ..cache import get_cache, get_mipmap_cache, get_scaled_pixmap_cache
 from ..optimizer import ImageOptimizer
-from ..workers import Worker
+from ..workers import Worker, get_task_queue
 from ..managers.autosave_encoding import AutosaveToken, get_autosave_encoder
 from utils.image_operations import apply_filter as pil_apply_filter, adjust_brightness as pil_brightness, adjust_contrast as pil_contrast
 from PIL import Image
-from io import BytesIO
+
+
+@lru_cache(maxsize=64)
+def _caption_font(family: str, size: int) -> tuple[QFont, QFontMetrics]:
+    """Return the shared bold caption font and its metrics for ``size``.
+
+    Every cell repaint used to rebuild these (one per candidate size while
+    fitting), which goes through the font database each time. Callers must
+    treat the returned font as read-only.
+    """
+    font = QFont(family, pointSize=size)
+    font.setBold(True)
+    return font, QFontMetrics(font)
+
+
+@lru_cache(maxsize=16)
+def _placeholder_pixmap(width: int, height: int, dpr: float, font: QFont) -> QPixmap:
+    """Return the rendered empty-cell placeholder for a cell size.
+
+    Empty cells share one pixmap per size instead of laying out the hint
+    text on every paint. Callers must treat the pixmap as read-only.
+    """
+    pixmap = QPixmap(max(1, round(width * dpr)), max(1, round(height * dpr)))
+    pixmap.setDevicePixelRatio(dpr)
+    pixmap.fill(QColor(245, 245, 245))
+    painter = QPainter(pixmap)
+    painter.setPen(QColor(180, 180, 180))
+    font = QFont(font)
+    font.setPointSize(10)
+    painter.setFont(font)
+    painter.drawText(QRect(0, 0, width, height), Qt.AlignCenter, "Drop Image Here\nCtrl+Click to Select")
+    painter.end()
+    return pixmap
 
 
 class ImageMimeData(QMimeData):
-    """Custom MIME data for transferring QPixmap and source widget."""
+    """Custom MIME data for transferring QPixmap and source widget.
+
+    In-app drops swap through ``source_widget``, so the pixmap is only
+    serialized if some consumer actually asks for the bytes.
+    """
+    PIXMAP_FORMAT = "application/x-pixmap"
+
     def __init__(self, pixmap: QPixmap, source_widget: "CollageCell"):
         super().__init__()
         self._pixmap = pixmap
         self.source_widget = source_widget
+
+    def hasFormat(self, mime_type: str) -> bool:
+        return mime_type == self.PIXMAP_FORMAT or super().hasFormat(mime_type)
+
+    def formats(self) -> list:
+        return [self.PIXMAP_FORMAT, *super().formats()]
+
+    def retrieveData(self, mime_type: str, preferred_type):
+        if mime_type != self.PIXMAP_FORMAT:
+            return super().retrieveData(mime_type, preferred_type)
         ba = QByteArray()
         stream = QDataStream(ba, QIODevice.WriteOnly)
-        stream << pixmap.toImage()
-        self.setData("application/x-pixmap", ba)
+        stream << self._pixmap.toImage()
+        return ba
 
     def image(self) -> QPixmap:
         return self._pixmap
 
 
+class _PendingOriginal:
+    """Routes a background original decode to the cell showing its picture.
+
+    A swap can move the display copy to another cell before the original
+    arrives; the swap re-points ``cell`` so the result follows the picture.
+    """
+
+    __slots__ = ("cell",)
+
+    def __init__(self, cell: "CollageCell") -> None:
+        self.cell = cell
+
+
 class CollageCell(QWidget):
     """Individual cell in a CollageWidget grid."""
+
+    # Per-picture state exchanged by an internal drag-and-drop swap. The
+    # scaled-pixmap memo is derived from the pictures, so it moves with them
+    # rather than being rebuilt.
+    _SWAPPED_IMAGE_STATE = (
+        "pixmap",
+        "original_pixmap",
+        "caption",
+        "_scaled_key",
+        "_scaled_pixmap",
+        "_pending_original",
+    )
+    _SELECTION_FILL = QColor(29, 78, 216, 40)  # subtle focus overlay
+    _SELECTION_PEN = QPen(QColor(29, 78, 216), 3, Qt.SolidLine, Qt.SquareCap, Qt.RoundJoin)
+
     def __init__(
         self,
         cell_id: int,
@@ -104,6 +180,16 @@ class CollageCell(QWidget):
         self._autosave_pending: bool = False
         self._is_loading: bool = False
         self._error_message: Optional[str] = None
+        # Bumped by every load and clear; async results from an older
+        # generation are dropped instead of overwriting newer content.
+        self._load_generation: int = 0
+        # Last scaled pixmap drawn and the key it was scaled for; repaints at
+        # the same size skip the shared cache (and survive its evictions).
+        self._scaled_key: Optional[tuple] = None
+        self._scaled_pixmap: Optional[QPixmap] = None
+        # Set while the full-resolution original of a display-size load is
+        # still decoding.
+        self._pending_original: Optional[_PendingOriginal] = None
 
         logging.info("Cell %d created; size %dx%d", cell_id, cell_size, cell_size)
 
@@ -117,11 +203,13 @@ class CollageCell(QWidget):
         if getattr(self, "_selected", False) == new_val:
             return
         self._selected = new_val
+        note_selection = getattr(self.parent(), "_note_selection", None)
+        if note_selection is not None:
+            note_selection(self, new_val)
+        # Selection is drawn in paintEvent and no stylesheet rule keys off
+        # this property, so the cell is not re-polished: a style sheet
+        # re-polish per cell dominated the cost of bulk selection changes.
         self.setProperty('selected', new_val)
-        style = self.style()
-        if style:
-            style.unpolish(self)
-            style.polish(self)
         self.update()
 
     def focusInEvent(self, event) -> None:
@@ -132,8 +220,19 @@ class CollageCell(QWidget):
         self.update()
         super().focusOutEvent(event)
 
-    def setImage(self, pixmap: QPixmap, *, original: Optional[QPixmap] = None) -> None:
+    def setImage(
+        self,
+        pixmap: QPixmap,
+        *,
+        original: Optional[QPixmap] = None,
+    ) -> None:
         """Set the display pixmap while preserving an optional original."""
+        if self.pixmap is not None and self.pixmap is not pixmap:
+            get_scaled_pixmap_cache().invalidate(self.pixmap)
+        self._scaled_key = self._scaled_pixmap = None
+        self._pending_original = None
+        # QPixmap is implicitly shared; cells only ever reassign pixmaps, never
+        # paint into them, so sharing the caller's (or cache's) data is safe.
         self.pixmap = pixmap
         if original is not None:
             self.original_pixmap = original
@@ -145,6 +244,11 @@ class CollageCell(QWidget):
 
     def clearImage(self) -> None:
         """Clear image and metadata."""
+        self._load_generation += 1
+        self._is_loading = False
+        if self.pixmap is not None:
+            get_scaled_pixmap_cache().invalidate(self.pixmap)
+        self._scaled_key = self._scaled_pixmap = None
         self.pixmap = None
         self.original_pixmap = None
         self.caption = ""
@@ -155,13 +259,12 @@ class CollageCell(QWidget):
         """Paint placeholder if empty, otherwise image and optional caption."""
         painter = QPainter(self)
         try:
-            painter.setRenderHint(QPainter.Antialiasing)
-            painter.setRenderHint(QPainter.SmoothPixmapTransform)
-            painter.setRenderHint(QPainter.TextAntialiasing)
+            # Hints are enabled per branch: loading/error text and the
+            # placeholder blit need only the default TextAntialiasing, and
+            # SmoothPixmapTransform would push them onto a slower blit path.
             img_rect = None
             self._top_caption_overflow = False
             self._bottom_caption_overflow = False
-            self._bottom_caption_overflow = False
             if self._is_loading:
                 self._draw_loading(painter)
             elif self._error_message:
@@ -169,6 +272,9 @@ class CollageCell(QWidget):
             elif not self.pixmap:
                 self._draw_placeholder(painter)
             else:
+                painter.setRenderHints(
+                    QPainter.Antialiasing | QPainter.SmoothPixmapTransform
+                )
                 img_rect = self._draw_image(painter)
                 # Legacy single-caption support
                 if self.caption and not self.top_caption and not self.bottom_caption:
@@ -185,18 +291,14 @@ class CollageCell(QWidget):
             if self._bottom_caption_overflow:
                 tips.append("Bottom caption too long for image")
             self.setToolTip("; ".join(tips) if tips else "")
+            if self.selected or self.hasFocus():
+                painter.setRenderHint(QPainter.Antialiasing)
             if self.selected:
                 painter.save()
-                highlight = QColor(29, 78, 216, 40)  # subtle focus overlay
-                painter.setPen(Qt.NoPen)
-                painter.setBrush(highlight)
-                painter.drawRoundedRect(self.rect().adjusted(1, 1, -1, -1), 6, 6)
-                pen = QPen(QColor(29, 78, 216))
-                pen.setWidth(3)
-                pen.setJoinStyle(Qt.RoundJoin)
-                painter.setPen(pen)
-                painter.setBrush(Qt.NoBrush)
-                painter.drawRoundedRect(self.rect().adjusted(1, 1, -1, -1), 6, 6)
+                # One call fills the subtle overlay and strokes the opaque
+                # border on top of it.
+                painter.setPen(self._SELECTION_PEN)
+                painter.setBrush(self._SELECTION_FILL)
                 painter.drawRoundedRect(self.rect().adjusted(1, 1, -1, -1), 6, 6)
                 painter.restore()
             if self.hasFocus():
@@ -246,21 +348,62 @@ class CollageCell(QWidget):
         painter.drawText(rect, Qt.AlignCenter, "Image Error")
 
     def _draw_placeholder(self, painter: QPainter) -> None:
-        rect = self.rect()
-        painter.fillRect(rect, QColor(245, 245, 245))
-        painter.setPen(QColor(180, 180, 180))
-        font = painter.font(); font.setPointSize(10); painter.setFont(font)
-        painter.drawText(rect, Qt.AlignCenter, "Drop Image Here\nCtrl+Click to Select")
+        painter.drawPixmap(
+            0,
+            0,
+            _placeholder_pixmap(self.width(), self.height(), self.devicePixelRatioF(), self.font()),
+        )
 
     def _draw_image(self, painter: QPainter) -> QRect:
         rect = self.rect()
-        scaled = self.pixmap.scaled(rect.size(), self.aspect_ratio_mode, self.transformation_mode)
+        key = (
+            self.pixmap.cacheKey(),
+            rect.width(),
+            rect.height(),
+            self.aspect_ratio_mode,
+            self.transformation_mode,
+        )
+        if key == self._scaled_key:
+            scaled = self._scaled_pixmap
+        else:
+            scaled = get_scaled_pixmap_cache().get_or_scale(
+                self._scale_source(rect.size()),
+                rect.size(),
+                self.aspect_ratio_mode,
+                self.transformation_mode,
+            )
+            self._scaled_key, self._scaled_pixmap = key, scaled
         x = (rect.width() - scaled.width()) // 2
         y = (rect.height() - scaled.height()) // 2
         target = QRect(x, y, scaled.width(), scaled.height())
         painter.drawPixmap(target, scaled)
         return target
 
+    def _scale_source(self, target: QSize) -> QPixmap:
+        """Return the pixmap to scale into ``target``.
+
+        The display pixmap is sized for the cell at load time. When the cell
+        has since grown (merge, larger window) and the original has more
+        detail, scale from the nearest mip level of the original instead of
+        upscaling the display copy; the level is at most 2x the target, so
+        the smooth scale stays cheap.
+        """
+        display = self.pixmap
+        original = self.original_pixmap
+        fitted = display.size().scaled(target, self.aspect_ratio_mode)
+        if (
+            original is None
+            or original.width() <= display.width()
+            or (display.width() >= fitted.width() and display.height() >= fitted.height())
+        ):
+            return display
+        # Halved copies of the original live in a shared, byte-bounded cache
+        # keyed by its cacheKey, so cells showing the same original share them.
+        levels = get_mipmap_cache().get_or_build(original, ImageOptimizer.build_mipmaps)
+        return ImageOptimizer.pick_mipmap(
+            [original, *levels], original.size().scaled(target, self.aspect_ratio_mode)
+        )
+
     def _draw_legacy_caption(self, painter: QPainter) -> None:
         rect = self.rect()
         font = painter.font()
@@ -308,7 +451,7 @@ class CollageCell(QWidget):
         painter.setPen(pen)
         painter.setBrush(self.caption_fill_color)
 
-        metrics = QFontMetrics(font)
+        metrics = _caption_font(font.family(), font.pointSize())[1]
         total_text_height = len(lines) * line_spacing - (line_spacing - metrics.ascent())
         y = area_top + max(0, (area_height - total_text_height) // 2) + ascent
         for line in lines:
@@ -328,9 +471,7 @@ class CollageCell(QWidget):
         """
         words = text.split()
         for size in range(self.caption_max_size, self.caption_min_size - 1, -1):
-            font = QFont(self.caption_font_family, pointSize=size)
-            font.setBold(True)
-            metrics = QFontMetrics(font)
+            font, metrics = _caption_font(self.caption_font_family, size)
             line_spacing = metrics.lineSpacing()
             ascent = metrics.ascent()
             lines: list[str] = []
@@ -348,9 +489,7 @@ class CollageCell(QWidget):
             if total_h <= max_h:
                 return font, lines, line_spacing, ascent, False
         # Ellipsize last line at min font
-        font = QFont(self.caption_font_family, pointSize=self.caption_min_size)
-        font.setBold(True)
-        metrics = QFontMetrics(font)
+        font, metrics = _caption_font(self.caption_font_family, self.caption_min_size)
         line_spacing = metrics.lineSpacing()
         ascent = metrics.ascent()
         lines = []
@@ -382,11 +521,15 @@ class CollageCell(QWidget):
 
         # Exclusive selection when no modifier is held
         parent = self.parent()
-        sibling_cells = getattr(parent, "cells", None)
-        if sibling_cells:
-            for other in sibling_cells:
-                if other is not self and getattr(other, "selected", False):
-                    other.selected = False
+        if hasattr(parent, "selected_count"):
+            # Nothing to clear when this cell already is the whole selection.
+            only_self = parent.selected_count == (1 if self.selected else 0)
+            sibling_cells = [] if only_self else parent.selected_cells()
+        else:
+            sibling_cells = getattr(parent, "cells", None) or []
+        for other in sibling_cells:
+            if other is not self and getattr(other, "selected", False):
+                other.selected = False
         if not self.selected:
             self.selected = True
             logging.info("Cell %d: selected=%s", self.cell_id, self.selected)
@@ -504,20 +647,10 @@ class CollageCell(QWidget):
         self.update()
 
     def _qimage_to_pil(self) -> Image.Image:
-        img = self.pixmap.toImage()
-        buffer = QBuffer()
-        buffer.open(QBuffer.ReadWrite)
-        img.save(buffer, 'PNG')
-        pil_img = Image.open(BytesIO(buffer.data()))
-        pil_img.load()
-        return pil_img
+        return ImageOptimizer.to_pil(self.pixmap.toImage())
 
     def _pil_to_qpixmap(self, pil_img: Image.Image) -> QPixmap:
-        out = BytesIO()
-        pil_img.save(out, format='PNG')
-        ba = QByteArray(out.getvalue())
-        qimg = QImage.fromData(ba, 'PNG')
-        return QPixmap.fromImage(qimg)
+        return QPixmap.fromImage(ImageOptimizer.from_pil(pil_img))
 
     def _apply_pil_filter(self, name: str) -> None:
         try:
@@ -565,11 +698,7 @@ class CollageCell(QWidget):
         if mime.hasFormat("application/x-pixmap"):
             source = getattr(mime, 'source_widget', None)
             if source and source is not self:
-                self.pixmap, source.pixmap = source.pixmap, self.pixmap
-                self.original_pixmap, source.original_pixmap = source.original_pixmap, self.original_pixmap
-                self.caption, source.caption = source.caption, self.caption
-                self._schedule_autosave_encoding(self.original_pixmap or self.pixmap)
-                source._schedule_autosave_encoding(source.original_pixmap or source.pixmap)
+                self._swap_image_with(source)
                 self.update(); source.update()
                 event.acceptProposedAction()
                 return
@@ -582,21 +711,78 @@ class CollageCell(QWidget):
                 return
         event.ignore()
 
+    def _swap_image_with(self, other: "CollageCell") -> None:
+        """Exchange pictures (and everything derived from them) with ``other``."""
+        for name in self._SWAPPED_IMAGE_STATE:
+            mine = getattr(self, name)
+            setattr(self, name, getattr(other, name))
+            setattr(other, name, mine)
+        for cell in (self, other):
+            if cell._pending_original is not None:
+                cell._pending_original.cell = cell
+        if self._autosave_pending or other._autosave_pending:
+            self._schedule_autosave_encoding(self.original_pixmap or self.pixmap)
+            other._schedule_autosave_encoding(other.original_pixmap or other.pixmap)
+        else:
+            # Both encodings are final, so they follow their pictures
+            # instead of encoding both images again.
+            self._autosave_payload, other._autosave_payload = (
+                other._autosave_payload,
+                self._autosave_payload,
+            )
+
+    def load_cached(self, file_path: str) -> bool:
+        """Show ``file_path`` from the image cache; return False on a miss.
+
+        Entries are keyed by the file's path, mtime and size plus this
+        cell's size, so repeated drops and re-adds skip decoding entirely.
+        """
+        cached, _ = get_cache().get(self._cache_key(file_path))
+        if not cached:
+            return False
+        if isinstance(cached, tuple) and len(cached) == 2:
+            display_pix, original_pix = cached
+        else:
+            display_pix, original_pix = cached, None
+        self._load_generation += 1
+        self._is_loading = False
+        self.setImage(display_pix, original=original_pix)
+        return True
+
+    def remember_image(
+        self,
+        file_path: str,
+        display: QPixmap,
+        original: Optional[QPixmap],
+        metadata: Optional[dict],
+    ) -> None:
+        """Show an image decoded elsewhere and add it to the image cache.
+
+        Without ``original`` (a display-size decode) the display copy stands
+        in until the full-resolution original is decoded in the background.
+        """
+        self._load_generation += 1
+        self._is_loading = False
+        cache_key = self._cache_key(file_path)
+        if original is None:
+            self.setImage(display, original=display)
+            self._load_original(file_path, cache_key, display, metadata)
+            return
+        self.setImage(display, original=original)
+        if metadata is not None:
+            get_cache().put(cache_key, (display, original), metadata)
+
     def _load_image(self, file_path: str) -> None:
         """Load, optimize, cache, and display image asynchronously."""
         try:
             # Cache check - fast path is synchronous
-            cache_key = self._cache_key(file_path)
-            cached, meta = get_cache().get(cache_key)
-            if cached:
-                if isinstance(cached, tuple) and len(cached) == 2:
-                    display_pix, original_pix = cached
-                else:
-                    display_pix, original_pix = cached, None
-                self.setImage(display_pix, original=original_pix)
+            if self.load_cached(file_path):
                 return
+            cache_key = self._cache_key(file_path)
 
             # Start async loading
+            self._load_generation += 1
+            generation = self._load_generation
             self._is_loading = True
             self._error_message = None
             self.setToolTip("")
@@ -604,57 +790,85 @@ class CollageCell(QWidget):
 
             target_size = self.size()
             
-            def _load_worker_fn() -> tuple[QImage, QImage]:
+            def _load_worker_fn() -> tuple[QImage, Optional[QImage], Optional[dict]]:
                 # Heavy lifting in worker thread
                 reader = QImageReader(file_path)
                 reader.setAutoTransform(True)
                 size = reader.size()
                 raw_fmt = reader.format().data() if reader.format() else None
                 fmt = raw_fmt.decode('utf-8') if raw_fmt else ''
+                # Header metadata for the cache, gathered here so the GUI
+                # thread never reopens or stats the file.
+                try:
+                    metadata = ImageOptimizer.metadata_from_reader(reader, file_path)
+                except Exception as e:
+                    logging.warning("Failed to read metadata for %s: %s", file_path, e)
+                    metadata = None
 
                 if fmt.lower() not in config.SUPPORTED_IMAGE_FORMATS:
                     raise IOError(f"Unsupported image format: '{fmt or 'unknown'}'")
 
-                max_dim = max(size.width(), size.height())
-                if max_dim > config.MAX_IMAGE_DIMENSION:
-                    scale = config.MAX_IMAGE_DIMENSION / max_dim
-                    reader.setScaledSize(
-                        QSize(int(size.width()*scale), int(size.height()*scale))
-                    )
+                # Sources far larger than the cell are decoded straight at
+                # display size (JPEG uses IDCT scaling) so the cell paints
+                # quickly; the full-resolution original follows separately.
+                display_decode = ImageOptimizer.scaled_decode_size(size, target_size)
+                if display_decode is not None:
+                    img = ImageOptimizer.read_display_decode(reader, file_path, display_decode)
+                else:
+                    decode_size = ImageOptimizer.capped_decode_size(size)
+                    if decode_size is not None:
+                        reader.setScaledSize(decode_size)
+                    img = reader.read()
 
-                img = reader.read()
                 if img.isNull() or img.width() <= 0 or img.height() <= 0:
                     err = reader.errorString() or "Invalid or empty image data"
                     raise IOError(f"Failed to read image: {err}")
 
+                ImageOptimizer.prepare_for_paint(img)
                 # Create optimized versions (still as QImages, not Map)
                 # Note: QPixmap cannot be created in worker thread safely
                 optimized = ImageOptimizer.optimize_image(img, target_size)
                 
                 # We return raw QImages
-                return (optimized, img)
+                return (optimized, None if display_decode else img, metadata)
 
             worker = Worker(_load_worker_fn)
 
-            def _on_result(result: tuple[QImage, QImage]) -> None:
-                optimized_img, full_img = result
+            def _is_current() -> bool:
+                # The cell may have been deleted (merge, grid rebuild) or
+                # given newer content while the worker was decoding.
+                return isValid(self) and self._load_generation == generation
+
+            def _on_result(result: tuple[QImage, Optional[QImage], Optional[dict]]) -> None:
+                if not _is_current():
+                    return
+                optimized_img, full_img, full_meta = result
                 # Convert to QPixmap on Main Thread
                 display_pix = QPixmap.fromImage(optimized_img)
-                original_pix = QPixmap.fromImage(full_img)
-                
-                self.setImage(display_pix, original=original_pix)
-                
-                # Cache full-quality
-                try:
-                    full_meta = ImageOptimizer.process_metadata(file_path)
-                    get_cache().put(cache_key, (display_pix, original_pix), full_meta)
-                except Exception as e:
-                    logging.warning("Failed to cache metadata for %s: %s", file_path, e)
+                if full_img is None:
+                    # Stand in for the original until the full decode lands.
+                    self.setImage(display_pix, original=display_pix)
+                    self._load_original(file_path, cache_key, display_pix, full_meta)
+                else:
+                    original_pix = (
+                        display_pix
+                        if full_img is optimized_img
+                        else QPixmap.fromImage(full_img)
+                    )
+                    self.setImage(display_pix, original=original_pix)
+                    # Cache full-quality
+                    if full_meta is not None:
+                        get_cache().put(
+                            cache_key, (display_pix, original_pix), full_meta
+                        )
                 
                 self._is_loading = False
                 self.update()
 
             def _on_error(err: str) -> None:
+                if not _is_current():
+                    logging.warning("Discarded stale load error for %s: %s", file_path, err)
+                    return
                 logging.error("Cell %d: async load error: %s", self.cell_id, err)
                 self._error_message = err
                 self.setToolTip(f"Error: {err}")
@@ -664,9 +878,9 @@ class CollageCell(QWidget):
             worker.signals.result.connect(_on_result)
             worker.signals.error.connect(_on_error)
             
-            # Use global thread pool
-            from PySide6.QtCore import QThreadPool
-            QThreadPool.globalInstance().start(worker)
+            # Shared, bounded image-loading queue; it also keeps the worker
+            # alive until its result has been delivered.
+            get_task_queue().add_task(worker)
 
         except Exception as e:
             logging.error("Cell %d: load setup error: %s", self.cell_id, e)
@@ -674,9 +888,80 @@ class CollageCell(QWidget):
             self.update()
 
 
+    def _load_original(
+        self,
+        file_path: str,
+        cache_key: str,
+        display_pix: QPixmap,
+        metadata: Optional[dict],
+    ) -> None:
+        """Decode the capped full-resolution original after a display-size load.
+
+        Queued below display loads so every dropped image paints first; export
+        of originals, autosave and the mip chain pick it up once it arrives.
+        The result goes to whichever cell still shows ``display_pix``, which
+        is another cell once the picture has been swapped away.
+        """
+        pending = self._pending_original = _PendingOriginal(self)
+
+        def _decode() -> QImage:
+            reader = QImageReader(file_path)
+            reader.setAutoTransform(True)
+            decode_size = ImageOptimizer.capped_decode_size(reader.size())
+            if decode_size is not None:
+                reader.setScaledSize(decode_size)
+            img = reader.read()
+            if img.isNull():
+                raise IOError(f"Failed to read image: {reader.errorString()}")
+            ImageOptimizer.prepare_for_paint(img)
+            return img
+
+        worker = Worker(_decode)
+
+        def _on_result(img: QImage) -> None:
+            original = QPixmap.fromImage(img)
+            if metadata is not None:
+                get_cache().put(cache_key, (display_pix, original), metadata)
+            cell = pending.cell
+            if (
+                not isValid(cell)
+                or cell._pending_original is not pending
+                or cell.pixmap is not display_pix
+            ):
+                return
+            cell._pending_original = None
+            cell.original_pixmap = original
+            # The paint memo is keyed on the display pixmap only; drop it so a
+            # grown cell rescales from the original's mip chain.
+            cell._scaled_key = cell._scaled_pixmap = None
+            cell.update()
+            cell._schedule_autosave_encoding(original)
+
+        def _on_error(err: str) -> None:
+            cell = pending.cell
+            valid = isValid(cell)
+            if valid and cell._pending_original is pending:
+                cell._pending_original = None
+            logging.warning(
+                "Cell %d: keeping display copy, original decode failed: %s",
+                cell.cell_id if valid else -1,
+                err,
+            )
+
+        worker.signals.result.connect(_on_result)
+        worker.signals.error.connect(_on_error)
+        get_task_queue().add_task(worker, priority=-1)
+
     def _cache_key(self, file_path: str) -> str:
+        # The file's mtime and byte size are part of the key, so an image
+        # edited on disk is decoded afresh instead of served stale.
+        try:
+            stat = os.stat(file_path)
+            stamp = f"{stat.st_mtime_ns}:{stat.st_size}"
+        except OSError:
+            stamp = "missing"
         size = self.size()
-        return f"{file_path}::{size.width()}x{size.height()}"
+        return f"{file_path}::{stamp}::{size.width()}x{size.height()}"
 
     def optimize_memory(self) -> None:
         """Release cached heavy data when under memory pressure."""
@@ -691,7 +976,6 @@ class CollageCell(QWidget):
                 Qt.SmoothTransformation
             )
             self.update()
-            gc.collect()
             self._schedule_autosave_encoding(self.original_pixmap or self.pixmap)
 
     @property
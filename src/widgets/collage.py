@@ -2,7 +2,7 @@
 """
 Defines CollageWidget: a grid of CollageCell widgets with merge/split functionality.
 """
-from typing import Optional, Tuple, List, Dict, Any
+from typing import Optional, Tuple, List, Dict, Any, Set
 import logging
 
 from PySide6.QtWidgets import QWidget, QGridLayout
@@ -61,6 +61,13 @@ class CollageWidget(QWidget):
         self.spacing = config.DEFAULT_SPACING
         self.merged_cells: Dict[Tuple[int,int], Tuple[int,int]] = {}
         self._cell_pos_map: Dict[CollageCell, Tuple[int,int]] = {}
+        # Reverse indexes kept in step with the two maps above: the cell at
+        # each top-left position, and the merge origin covering each position.
+        self._pos_cell_map: Dict[Tuple[int,int], CollageCell] = {}
+        self._merge_roots: Dict[Tuple[int,int], Tuple[int,int]] = {}
+        # Cells whose ``selected`` flag is set, maintained by the cells
+        # themselves so selection queries never walk the whole grid.
+        self._selected_cells: Set[CollageCell] = set()
         self._base_cell_size: Tuple[int, int] = (cell_size, cell_size)
 
         self._setup_layout()
@@ -207,6 +214,11 @@ class CollageWidget(QWidget):
             cell.deleteLater()
         self.cells.clear()
         self._cell_pos_map.clear()
+        self._pos_cell_map.clear()
+        self._selected_cells.clear()
+        # A freshly populated grid has no merges; callers re-apply them.
+        self.merged_cells.clear()
+        self._merge_roots.clear()
 
         # Create cells
         for r in range(self.rows):
@@ -215,28 +227,50 @@ class CollageWidget(QWidget):
                 cell = CollageCell(cell_id, self.cell_size, self)
                 self.grid_layout.addWidget(cell, r, c)
                 self.cells.append(cell)
-                self._cell_pos_map[cell] = (r, c)
+                self._place_cell(cell, r, c)
         self._apply_sizes()
         logging.info("CollageWidget: populated %dx%d grid.", self.rows, self.columns)
 
+    def _place_cell(self, cell: CollageCell, row: int, col: int) -> None:
+        self._cell_pos_map[cell] = (row, col)
+        self._pos_cell_map[(row, col)] = cell
+
+    def _forget_cell(self, cell: CollageCell) -> None:
+        self._selected_cells.discard(cell)
+        pos = self._cell_pos_map.pop(cell, None)
+        if pos is not None and self._pos_cell_map.get(pos) is cell:
+            del self._pos_cell_map[pos]
+
+    def _note_selection(self, cell: CollageCell, selected: bool) -> None:
+        """Record a cell's selection change (called by CollageCell.selected)."""
+        if selected:
+            self._selected_cells.add(cell)
+        else:
+            self._selected_cells.discard(cell)
+
+    def selected_cells(self) -> List[CollageCell]:
+        """Return the currently selected cells, in no particular order."""
+        return list(self._selected_cells)
+
+    @property
+    def selected_count(self) -> int:
+        """Number of selected cells, without building a list."""
+        return len(self._selected_cells)
+
     def get_cell_position(self, cell: CollageCell) -> Optional[Tuple[int,int]]:
         """Return the (row, col) of a cell or None if not found."""
         return self._cell_pos_map.get(cell)
 
     def get_cell_at(self, row: int, col: int) -> Optional[CollageCell]:
-        """Return the cell instance at grid position."""
-        # Check merged cells
-        if (row, col) in self.merged_cells:
-            # top-left of merged
-            for cell, pos in self._cell_pos_map.items():
-                if pos == (row, col):
-                    return cell
-            return None
-        # Regular
-        for cell, pos in self._cell_pos_map.items():
-            if pos == (row, col):
-                return cell
-        return None
+        """Return the cell whose top-left corner is at the grid position.
+
+        Positions covered by a merge, other than its origin, have no cell.
+        """
+        return self._pos_cell_map.get((row, col))
+
+    def merge_root_at(self, row: int, col: int) -> Optional[Tuple[int,int]]:
+        """Return the origin of the merged block covering a position, if any."""
+        return self._merge_roots.get((row, col))
 
     def is_valid_merge(self, start_row: int, start_col: int, rowspan: int, colspan: int) -> bool:
         """Ensure a rectangle is fully selected and within bounds."""
@@ -256,14 +290,15 @@ class CollageWidget(QWidget):
                 if not pos:
                     continue
                 # Expand if part of existing merge
-                for (mr, mc), (mrs, mcs) in self.merged_cells.items():
-                    if mr <= pos[0] < mr + mrs and mc <= pos[1] < mc + mcs:
-                        for rr in range(mr, mr + mrs):
-                            for cc in range(mc, mc + mcs):
-                                selected.add((rr, cc))
-                        break
-                else:
+                root = self._merge_roots.get(pos)
+                if root is None:
                     selected.add(pos)
+                    continue
+                mr, mc = root
+                mrs, mcs = self.merged_cells[root]
+                for rr in range(mr, mr + mrs):
+                    for cc in range(mc, mc + mcs):
+                        selected.add((rr, cc))
         if not required.issubset(selected):
             logging.warning("Not all required cells are selected for merge.")
             return False
@@ -307,14 +342,17 @@ class CollageWidget(QWidget):
         # Remove others
         for cell in others:
             self.grid_layout.removeWidget(cell)
-            del self._cell_pos_map[cell]
+            self._forget_cell(cell)
             self.cells.remove(cell)
             cell.deleteLater()
 
         # Adjust target
         self.grid_layout.addWidget(target, start_row, start_col, rowspan, colspan)
         self.merged_cells[(start_row, start_col)] = (rowspan, colspan)
-        self._cell_pos_map[target] = (start_row, start_col)
+        for r in range(start_row, start_row + rowspan):
+            for c in range(start_col, start_col + colspan):
+                self._merge_roots[(r, c)] = (start_row, start_col)
+        self._place_cell(target, start_row, start_col)
         target.row_span = rowspan
         target.col_span = colspan
         self._apply_sizes()
@@ -329,6 +367,9 @@ class CollageWidget(QWidget):
             logging.warning("No merged cell at (%d,%d) to split.", row, col)
             return False
         rowspan, colspan = self.merged_cells.pop(key)
+        for r in range(row, row + rowspan):
+            for c in range(col, col + colspan):
+                self._merge_roots.pop((r, c), None)
         merged_cell = self.get_cell_at(row, col)
         if not merged_cell:
             return False
@@ -340,7 +381,7 @@ class CollageWidget(QWidget):
 
         # Remove merged from layout
         self.grid_layout.removeWidget(merged_cell)
-        del self._cell_pos_map[merged_cell]
+        self._forget_cell(merged_cell)
         if merged_cell in self.cells:
             self.cells.remove(merged_cell)
         merged_cell.deleteLater()
@@ -358,7 +399,7 @@ class CollageWidget(QWidget):
                     cell.update()
                 self.grid_layout.addWidget(cell, r, c)
                 self.cells.append(cell)
-                self._cell_pos_map[cell] = (r, c)
+                self._place_cell(cell, r, c)
         self._apply_sizes()
         logging.info("Split merged cell at (%d,%d)", row, col)
         return True
@@ -402,12 +443,27 @@ class CollageWidget(QWidget):
         r, c, rs, cs = rect
         return self.merge_cells(r, c, rs, cs)
 
+    def set_all_selected(self, selected: bool) -> None:
+        """Select or deselect every cell with a single coalesced repaint.
+
+        Updates are suspended while the flags change so the per-cell
+        ``update()`` calls collapse into one repaint of the grid.
+        """
+        self.setUpdatesEnabled(False)
+        try:
+            for cell in self.cells if selected else self.selected_cells():
+                cell.selected = selected
+        finally:
+            self.setUpdatesEnabled(True)
+
     def selected_rectangle(self) -> Optional[Tuple[int, int, int, int]]:
         """Return (row, col, rowspan, colspan) if selection is a filled rectangle.
 
         Returns None if fewer than 2 cells are selected or the selection is non-rectangular.
         """
-        positions = [self.get_cell_position(c) for c in self.cells if c.selected]
+        if self.selected_count < 2:
+            return None
+        positions = [self.get_cell_position(c) for c in self._selected_cells]
         positions = [p for p in positions if p]
         if len(positions) < 2:
             return None
@@ -3,13 +3,22 @@
 Background task execution utilities for Collage Maker.
 Defines a unified Worker for QRunnable tasks, a TaskQueue, and batch processing support.
 """
+import heapq
+import itertools
 import logging
-from typing import Any, Callable, List, Optional
+import os
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
-from PySide6.QtCore import QRunnable, QThreadPool, QObject, Signal, QSize
+from PySide6.QtCore import (
+    QBuffer, QByteArray, QIODevice, QRunnable, QThreadPool, QObject, Qt, Signal, QSize, Slot
+)
 from PySide6.QtWidgets import QProgressDialog, QMessageBox
-from PySide6.QtGui import QImageReader, QPixmap
+from PySide6.QtGui import QImage, QImageReader, QPixmap
 
+from . import config
 from .cache import get_cache
 from .optimizer import ImageOptimizer
 
@@ -56,29 +65,56 @@ class Worker(QRunnable):
             self.signals.finished.emit()
 
 
-class TaskQueue:
-    """Queued task manager with priority support."""
-    def __init__(self, max_concurrent: int = 4):
-        self._queue: List[tuple[int, Worker]] = []
-        self.thread_pool = QThreadPool.globalInstance()
-        self.thread_pool.setMaxThreadCount(max_concurrent)
+class TaskQueue(QObject):
+    """Queued task manager with priority support and bounded concurrency.
+
+    Tasks live in a binary heap of ``(-priority, sequence, worker)`` entries:
+    higher priorities run first and the sequence number keeps equal
+    priorities in FIFO order without ever comparing Worker objects.
+
+    At most ``max_concurrent`` workers run at once on the queue's own
+    QThreadPool. Running workers stay referenced until their ``finished``
+    signal reaches the queue's thread; dropping them earlier lets Python
+    collect the signal object before its queued results are delivered.
+    """
+    def __init__(self, max_concurrent: int = 4, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self._queue: List[tuple[int, int, Worker]] = []
+        self._sequence = itertools.count()
+        self._running: Dict[WorkerSignals, Worker] = {}
+        self._max_concurrent = max(1, max_concurrent)
+        self.thread_pool = QThreadPool(self)
+        self.thread_pool.setMaxThreadCount(self._max_concurrent)
         self._processing = False
 
     def add_task(self, worker: Worker, priority: int = 0) -> None:
         """Schedule a Worker with an optional priority."""
-        self._queue.append((priority, worker))
-        self._queue.sort(key=lambda x: x[0], reverse=True)
+        heapq.heappush(self._queue, (-priority, next(self._sequence), worker))
         if not self._processing:
             self._process_next()
 
     def _process_next(self) -> None:
-        if not self._queue:
-            self._processing = False
-            return
+        """Start queued workers until the concurrency limit is reached."""
         self._processing = True
-        _, worker = self._queue.pop(0)
-        worker.signals.finished.connect(self._process_next)
-        self.thread_pool.start(worker)
+        try:
+            while self._queue and len(self._running) < self._max_concurrent:
+                _, _, worker = heapq.heappop(self._queue)
+                self._running[worker.signals] = worker
+                worker.signals.finished.connect(self._on_task_finished)
+                self.thread_pool.start(worker)
+        finally:
+            self._processing = False
+
+    @Slot()
+    def _on_task_finished(self) -> None:
+        signals = self.sender()
+        if signals is not None:
+            self._release(self._running.get(signals))
+
+    def _release(self, worker: Optional[Worker]) -> None:
+        if worker is not None:
+            self._running.pop(worker.signals, None)
+        self._process_next()
 
     def clear(self) -> None:
         """Remove all scheduled tasks."""
@@ -88,40 +124,171 @@ class TaskQueue:
         return not bool(self._queue)
 
 
+_task_queue: Optional[TaskQueue] = None
+_task_queue_lock = threading.Lock()
+
+
+def get_task_queue() -> TaskQueue:
+    """Return the shared queue used for image loading work."""
+    global _task_queue
+    with _task_queue_lock:
+        if _task_queue is None:
+            _task_queue = TaskQueue(config.IMAGE_LOAD_THREADS)
+        return _task_queue
+
+
+def _read_file(path: str) -> bytes:
+    with open(path, "rb") as handle:
+        return handle.read()
+
+
+def prefetch_files(
+    paths: Iterable[str], depth: int
+) -> Iterator[Tuple[str, Union[bytes, OSError]]]:
+    """Yield ``(path, data)`` in order while reading up to ``depth`` files ahead.
+
+    Reads run on a small thread pool so open/read latency overlaps with the
+    caller's decoding; a failed read yields the ``OSError`` instead of data.
+    The window bounds how many undecoded files are held in memory at once.
+    """
+    window: "deque[Tuple[str, Future]]" = deque()
+    pending = iter(paths)
+    with ThreadPoolExecutor(max_workers=max(1, depth)) as pool:
+        for path in itertools.islice(pending, max(1, depth)):
+            window.append((path, pool.submit(_read_file, path)))
+        while window:
+            path, future = window.popleft()
+            following = next(pending, None)
+            if following is not None:
+                window.append((following, pool.submit(_read_file, following)))
+            try:
+                yield path, future.result()
+            except OSError as exc:
+                yield path, exc
+
+
+def _decode_batch_image(
+    path: str, data: bytes, target_size: Optional[QSize]
+) -> Optional[Tuple[QImage, dict]]:
+    """Decode one prefetched file for the batch loader, or None on failure."""
+    buffer = QBuffer()
+    buffer.setData(QByteArray(data))
+    buffer.open(QIODevice.ReadOnly)
+    reader = QImageReader(buffer)
+    reader.setAutoTransform(True)
+    if not reader.canRead():
+        logging.error("Batch load failed: %s", reader.errorString())
+        return None
+    metadata = ImageOptimizer.metadata_from_reader(reader, path)
+    if target_size:
+        decode_size = ImageOptimizer.scaled_decode_size(reader.size(), target_size)
+        if decode_size is not None:
+            reader.setScaledSize(decode_size)
+    img = reader.read()
+    if img.isNull():
+        logging.error("Batch load failed: %s", reader.errorString())
+        return None
+    ImageOptimizer.prepare_for_paint(img)
+    return img, metadata
+
+
 class BatchProcessor:
     """Handles batch loading and caching of image files with a progress dialog."""
+
+    CACHE_FLUSH_SIZE = 16
+    PREFETCH_DEPTH = 8
+
     def __init__(self, parent_widget):
         self.parent = parent_widget
         self.thread_pool = QThreadPool.globalInstance()
+        # Kept for the processor's lifetime so consecutive batches reuse the
+        # decode threads (created lazily on first submit).
+        self._decoders = ThreadPoolExecutor(
+            max_workers=config.IMAGE_LOAD_THREADS, thread_name_prefix="batch-decode"
+        )
+
+    @staticmethod
+    def _is_cached(path: str) -> bool:
+        """Return whether the cache holds *path* decoded from its current mtime."""
+        cached, metadata = get_cache().get(path)
+        if cached is None or not metadata:
+            return False
+        try:
+            return metadata.get("timestamp") == os.stat(path).st_mtime
+        except OSError:
+            return False
+
+    def _collect(
+        self,
+        entry: Tuple[str, Optional[Future]],
+        pending: List[tuple[str, QPixmap, dict]],
+    ) -> None:
+        """Queue a finished decode for the cache, flushing full batches."""
+        path, future = entry
+        decoded = future.result() if future is not None else None
+        if decoded is None:
+            return
+        img, metadata = decoded
+        pending.append((path, QPixmap.fromImage(img), metadata))
+        if len(pending) >= self.CACHE_FLUSH_SIZE:
+            get_cache().put_many(pending)
+            pending.clear()
 
     def process_files(self, file_paths: List[str], target_size: Optional[QSize] = None) -> None:
         """Asynchronously load, optimize, and cache images, showing a cancellable progress dialog."""
         dialog = QProgressDialog("Processing images...", "Cancel", 0, len(file_paths), self.parent)
-        dialog.setWindowModality(True); dialog.show()
+        dialog.setWindowModality(Qt.WindowModal); dialog.show()
         cancelled = {"flag": False}
         dialog.canceled.connect(lambda: cancelled.__setitem__("flag", True))
 
         def _task(path_list):
-            for idx, path in enumerate(path_list):
+            # Cache writes are buffered and flushed in groups so the cache
+            # lock and eviction pass are paid once per batch, not per image.
+            pending: List[tuple[str, QPixmap, dict]] = []
+            # Files already cached from an unchanged mtime are neither read
+            # nor decoded again.
+            stale = [path for path in path_list if not self._is_cached(path)]
+            done = len(path_list) - len(stale)
+            if done:
+                yield int(done / len(path_list) * 100)
+            # File reads run ahead of decoding; decodes run in parallel (Qt's
+            # codecs release the GIL) and are consumed in submission order.
+            files = prefetch_files(stale, self.PREFETCH_DEPTH)
+            decoding: "deque[Tuple[str, Optional[Future]]]" = deque()
+            for path, data in files:
                 if cancelled["flag"]:
                     break
-                reader = QImageReader(path)
-                reader.setAutoTransform(True)
-                if target_size:
-                    reader.setScaledSize(target_size)
-                img = reader.read()
-                if img.isNull():
-                    logging.error("Batch load failed: %s", reader.errorString())
-                    continue
-                pix = QPixmap.fromImage(img)
-                get_cache().put(path, pix, ImageOptimizer.process_metadata(path))
-                progress = int((idx + 1) / len(path_list) * 100)
-                yield progress
+                if isinstance(data, OSError):
+                    logging.error("Batch load failed: %s", data)
+                    decoding.append((path, None))
+                else:
+                    future = self._decoders.submit(_decode_batch_image, path, data, target_size)
+                    decoding.append((path, future))
+                # Keep every decoder busy without holding the whole batch.
+                while len(decoding) > config.IMAGE_LOAD_THREADS:
+                    done += 1
+                    self._collect(decoding.popleft(), pending)
+                    yield int(done / len(path_list) * 100)
+            files.close()
+            while decoding and not cancelled["flag"]:
+                done += 1
+                self._collect(decoding.popleft(), pending)
+                yield int(done / len(path_list) * 100)
+            for _, future in decoding:
+                if future is not None:
+                    future.cancel()
+            if pending:
+                get_cache().put_many(pending)
 
         # Wrap generator in a worker
         def run_batch():
+            # Many files share one percent step on large batches; emitting
+            # only on change avoids a queued dialog repaint per image.
+            last = None
             for p in _task(file_paths):
-                batch_worker.signals.progress.emit(p)
+                if p != last:
+                    batch_worker.signals.progress.emit(p)
+                    last = p
             return True
 
         batch_worker = Worker(run_batch)
@@ -0,0 +1,9 @@
+"""Shared pytest fixtures."""
+import pytest
+from src import config
+
+
+@pytest.fixture(autouse=True)
+def _isolated_thumbnail_cache(tmp_path, monkeypatch):
+    """Keep display-size decodes written by tests out of the user's cache."""
+    monkeypatch.setattr(config, "THUMBNAIL_CACHE_DIR", str(tmp_path / "thumbnails"))
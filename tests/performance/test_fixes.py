@@ -43,7 +43,7 @@ def test_performance_monitor_triggers_optimization(app):
     real_parent.collage.optimize_memory.assert_called_once()
 
 def test_async_image_loading_uses_worker(app, tmp_path):
-    """PERF-002: Validate _load_image uses QThreadPool."""
+    """PERF-002: Validate _load_image hands a worker to the shared task queue."""
     cell = CollageCell(1)
     
     # Create dummy image
@@ -51,20 +51,439 @@ def test_async_image_loading_uses_worker(app, tmp_path):
     with open(img_path, "wb") as f:
         f.write(b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01\x00\x00\x00\x01\x08\x06\x00\x00\x00\x1f\x15\xc4\x89\x00\x00\x00\nIDATx\x9cc\x00\x01\x00\x00\x05\x00\x01\r\n-\xb4\x00\x00\x00\x00IEND\xaeB`\x82")
         
-    import logging
-    # We need to patch where QThreadPool is defined/imported.
-    # Since it is imported inside the method in cell.py:
-    # from PySide6.QtCore import QThreadPool
-    # We can patch 'PySide6.QtCore.QThreadPool.globalInstance'
-    
-    with patch('PySide6.QtCore.QThreadPool.globalInstance') as mock_pool_instance:
+    with patch('src.widgets.cell.get_task_queue') as mock_queue:
         with patch('src.widgets.cell.logging.error') as mock_log:
             cell._load_image(str(img_path))
             
             if mock_log.called:
                  raise RuntimeError(f"Caught logged error: {mock_log.call_args}")
 
-        # Should start a worker
-        mock_pool_instance.return_value.start.assert_called_once()
+        # Should queue a worker
+        mock_queue.return_value.add_task.assert_called_once()
         
     assert cell._is_loading is True
+
+def test_caption_fonts_are_shared_between_fits(app):
+    """Caption fitting reuses cached fonts instead of rebuilding them per paint."""
+    from src.widgets.cell import _caption_font
+
+    cell = CollageCell(1)
+    cell.caption_min_size = cell.caption_max_size = 18
+    font, lines, *_ = cell._fit_text("hello world", 500, 500)
+    again, *_ = cell._fit_text("other text", 500, 500)
+
+    assert font is again
+    assert font is _caption_font(cell.caption_font_family, 18)[0]
+    assert font.bold() and lines == ["hello world"]
+
+def test_bulk_selection_skips_style_repolish(app):
+    """Selection is painted by the cell, so toggling it must not re-polish."""
+    collage = CollageWidget(rows=3, columns=3)
+    style = MagicMock(wraps=collage.cells[0].style())
+    with patch.object(CollageCell, "style", return_value=style):
+        collage.set_all_selected(True)
+
+    assert all(cell.selected for cell in collage.cells)
+    assert all(cell.property("selected") for cell in collage.cells)
+    style.polish.assert_not_called()
+
+def test_cell_reuses_scaled_pixmap_between_paints(app):
+    """Repaints at an unchanged size reuse the cell's last scaled pixmap."""
+    from PySide6.QtGui import QImage, QPainter, QPixmap
+
+    cell = CollageCell(1, 120)
+    source = QPixmap(300, 200)
+    source.fill()
+    cell.setImage(source)
+    canvas = QImage(120, 120, QImage.Format_ARGB32_Premultiplied)
+
+    cache = MagicMock()
+    cache.get_or_scale.side_effect = lambda pix, size, *_: pix.scaled(size)
+    with patch("src.widgets.cell.get_scaled_pixmap_cache", return_value=cache):
+        for _ in range(3):
+            painter = QPainter(canvas)
+            cell._draw_image(painter)
+            painter.end()
+        assert cache.get_or_scale.call_count == 1
+
+        cell.setImage(QPixmap(source))
+        painter = QPainter(canvas)
+        cell._draw_image(painter)
+        painter.end()
+    assert cache.get_or_scale.call_count == 2
+
+def test_grown_cell_scales_from_original_mipmap(app):
+    """A cell larger than its display copy draws from a mip of the original."""
+    from PySide6.QtCore import QSize
+    from PySide6.QtGui import QPixmap
+
+    cell = CollageCell(1, 100)
+    display = QPixmap(100, 100)
+    original = QPixmap(1600, 1600)
+    cell.setImage(display, original=original)
+
+    assert cell._scale_source(QSize(100, 100)) is display
+    source = cell._scale_source(QSize(300, 300))
+    assert source.size() == QSize(400, 400)
+    assert cell._scale_source(QSize(300, 300)) is source
+
+def test_mip_chains_live_in_byte_bounded_cache_cleared_by_monitor(app):
+    """Mip levels are held by the shared cache, which memory pressure clears."""
+    from PySide6.QtCore import QSize
+    from PySide6.QtGui import QPixmap
+    from src.cache import MipmapCache
+
+    mips = MipmapCache(max_size=8, max_bytes=400 * 400 * 4)
+    cell = CollageCell(1, 100)
+    original = QPixmap(1600, 1600)
+    cell.setImage(QPixmap(100, 100), original=original)
+    with patch("src.widgets.cell.get_mipmap_cache", return_value=mips):
+        source = cell._scale_source(QSize(300, 300))
+        assert source.size() == QSize(400, 400)
+        # 800x800 alone exceeds the budget; the newest chain is still kept.
+        assert mips._bytes == MipmapCache._cost(mips.get_or_build(original, list))
+
+    real_parent = QWidget()
+    real_parent.collage = MagicMock()
+    with patch("src.managers.performance.QTimer"):
+        monitor = PerformanceMonitor(real_parent)
+    with patch("src.managers.performance.get_mipmap_cache", return_value=mips), patch(
+        "src.managers.performance.psutil"
+    ):
+        monitor._optimize()
+    assert mips._bytes == 0 and not mips._cache
+
+def test_stale_async_load_does_not_override_newer_content(app, tmp_path):
+    """A slow earlier load must not replace a later image or a cleared cell."""
+    from PySide6.QtGui import QColor, QImage
+
+    paths = []
+    for name, color in (("first.png", "red"), ("second.png", "blue")):
+        image = QImage(8, 8, QImage.Format_RGB32)
+        image.fill(QColor(color))
+        image.save(str(tmp_path / name))
+        paths.append(str(tmp_path / name))
+
+    cell = CollageCell(1, 64)
+    with patch("src.widgets.cell.get_cache") as cache, patch(
+        "src.widgets.cell.get_task_queue"
+    ) as queue:
+        cache.return_value.get.return_value = (None, None)
+        cell._load_image(paths[0])
+        cell._load_image(paths[1])
+        first, second = [c.args[0] for c in queue.return_value.add_task.call_args_list]
+
+        second.run()
+        first.run()
+        assert cell.pixmap.toImage().pixelColor(0, 0) == QColor("blue")
+        assert cell._is_loading is False
+
+        cell._load_image(paths[0])
+        pending = queue.return_value.add_task.call_args.args[0]
+        cell.clearImage()
+        pending.run()
+    assert cell.pixmap is None
+
+def test_large_drop_paints_display_decode_before_original(app, tmp_path):
+    """Oversized sources decode at display size first, the original later."""
+    from PySide6.QtCore import QSize
+    from PySide6.QtGui import QColor, QImage
+
+    path = tmp_path / "large.png"
+    image = QImage(1200, 600, QImage.Format_RGB32)
+    image.fill(QColor("green"))
+    image.save(str(path))
+
+    cell = CollageCell(1, 64)
+    with patch("src.widgets.cell.get_cache") as cache, patch(
+        "src.widgets.cell.get_task_queue"
+    ) as queue:
+        cache.return_value.get.return_value = (None, None)
+        cell._load_image(str(path))
+        queue.return_value.add_task.call_args.args[0].run()
+
+        assert cell.pixmap is not None and cell._is_loading is False
+        assert cell.original_pixmap.width() < 1200
+        cache.return_value.put.assert_not_called()
+        original_task = queue.return_value.add_task.call_args
+        assert original_task.kwargs == {"priority": -1}
+
+        original_task.args[0].run()
+    assert cell.original_pixmap.size() == QSize(1200, 600)
+    cache.return_value.put.assert_called_once()
+
+def test_original_decode_follows_picture_swapped_between_phases(app, tmp_path):
+    """A swap before the original arrives routes the original to the new holder."""
+    from PySide6.QtCore import QSize
+    from PySide6.QtGui import QColor, QImage, QPixmap
+
+    path = tmp_path / "large.png"
+    image = QImage(1200, 600, QImage.Format_RGB32)
+    image.fill(QColor("green"))
+    image.save(str(path))
+
+    first, second = CollageCell(1, 64), CollageCell(2, 64)
+    small = QPixmap(30, 30)
+    with patch("src.widgets.cell.get_cache") as cache, patch(
+        "src.widgets.cell.get_task_queue"
+    ) as queue:
+        cache.return_value.get.return_value = (None, None)
+        second.setImage(small)
+        first._load_image(str(path))
+        queue.return_value.add_task.call_args.args[0].run()
+        display = first.pixmap
+        original_task = queue.return_value.add_task.call_args
+
+        first._swap_image_with(second)
+        original_task.args[0].run()
+
+    assert second.pixmap is display
+    assert second.original_pixmap.size() == QSize(1200, 600)
+    assert first.pixmap is small and first.original_pixmap is small
+    assert first._pending_original is None and second._pending_original is None
+
+def test_grown_cell_repaints_from_original_once_it_arrives(app, tmp_path):
+    """The paint memo is dropped when the full original replaces the stand-in."""
+    from PySide6.QtGui import QColor, QImage
+
+    path = tmp_path / "large.png"
+    image = QImage(1200, 600, QImage.Format_RGB32)
+    image.fill(QColor("green"))
+    image.save(str(path))
+
+    cell = CollageCell(1, 64)
+    with patch("src.widgets.cell.get_cache") as cache, patch(
+        "src.widgets.cell.get_task_queue"
+    ) as queue:
+        cache.return_value.get.return_value = (None, None)
+        cell._load_image(str(path))
+        queue.return_value.add_task.call_args.args[0].run()
+        display = cell.pixmap
+        cell.setFixedSize(400, 200)
+        scale_source = cell._scale_source
+        sources = []
+
+        def _recording_source(target):
+            sources.append(scale_source(target))
+            return sources[-1]
+
+        with patch.object(cell, "_scale_source", _recording_source):
+            cell.grab()
+            queue.return_value.add_task.call_args.args[0].run()
+            assert cell._scaled_key is None
+            cell.grab()
+    assert sources[0] is display
+    assert sources[-1].width() > display.width()
+
+def test_set_image_shares_pixmap_data(app):
+    """setImage keeps the implicitly shared pixmap instead of deep-copying."""
+    from PySide6.QtGui import QPixmap
+
+    pix = QPixmap(32, 32)
+    cell = CollageCell(1, 64)
+    with patch.object(cell, "_schedule_autosave_encoding"):
+        cell.setImage(pix)
+    assert cell.pixmap.cacheKey() == pix.cacheKey()
+    assert cell.original_pixmap.cacheKey() == pix.cacheKey()
+
+def test_cell_optimize_memory_leaves_collection_to_monitor(app):
+    """Per-cell trimming must not run a full GC for every cell."""
+    from PySide6.QtGui import QPixmap
+
+    cell = CollageCell(1, 32)
+    cell.pixmap = QPixmap(400, 400)
+    with patch("gc.collect") as collect, patch.object(cell, "_schedule_autosave_encoding"):
+        cell.optimize_memory()
+    assert cell.pixmap.width() <= 64
+    collect.assert_not_called()
+
+def test_cell_load_reuses_reader_metadata(app, tmp_path):
+    """The load worker hands its header metadata through to the cache."""
+    from PySide6.QtGui import QColor, QImage
+
+    path = tmp_path / "small.png"
+    image = QImage(40, 40, QImage.Format_RGB32)
+    image.fill(QColor("red"))
+    image.save(str(path))
+
+    cell = CollageCell(1, 64)
+    with patch("src.widgets.cell.get_cache") as cache, patch(
+        "src.widgets.cell.get_task_queue"
+    ) as queue, patch(
+        "src.optimizer.ImageOptimizer.process_metadata", side_effect=AssertionError
+    ):
+        cache.return_value.get.return_value = (None, None)
+        cell._load_image(str(path))
+        queue.return_value.add_task.call_args.args[0].run()
+
+    metadata = cache.return_value.put.call_args.args[2]
+    assert metadata["size"].width() == 40 and metadata["format"] == "png"
+
+def test_collage_tracks_selection_without_scanning(app):
+    """The collage keeps its own index of selected cells through merges."""
+    collage = CollageWidget(rows=2, columns=2)
+    first, second = collage.cells[0], collage.cells[1]
+    first.selected = True
+    second.selected = True
+    assert set(collage.selected_cells()) == {first, second}
+    assert collage.selected_count == 2
+    assert collage.selected_rectangle() == (0, 0, 1, 2)
+
+    assert collage.merge_selected()
+    assert collage.selected_cells() == [first]
+
+    collage.set_all_selected(False)
+    assert collage.selected_cells() == []
+    assert collage.selected_count == 0
+    assert collage.selected_rectangle() is None
+
+def test_selection_overlay_is_one_draw_call(app):
+    """The selection fill and border are painted by a single call."""
+    from PySide6.QtGui import QPainter
+
+    cell = CollageCell(1, 64)
+    cell.selected = True
+    with patch.object(QPainter, "drawRoundedRect") as draw:
+        cell.grab()
+    assert draw.call_count == 1
+
+def test_cells_share_cached_mip_chain_and_see_file_edits(app, tmp_path):
+    """Cells loading the same file share one mip chain; edits change the key."""
+    import os
+
+    from PySide6.QtCore import QSize
+    from PySide6.QtGui import QColor, QImage
+    from src.cache import ImageCache, override_cache
+
+    path = tmp_path / "shared.png"
+    image = QImage(400, 400, QImage.Format_RGB32)
+    image.fill(QColor("red"))
+    image.save(str(path))
+
+    first, second = CollageCell(1, 100), CollageCell(2, 100)
+    with override_cache(ImageCache()), patch(
+        "src.widgets.cell.get_task_queue"
+    ) as queue, patch.object(CollageCell, "_schedule_autosave_encoding"):
+        first._load_image(str(path))
+        queue.return_value.add_task.call_args.args[0].run()
+        queue.reset_mock()
+        second._load_image(str(path))
+        queue.return_value.add_task.assert_not_called()
+
+        assert second.original_pixmap.cacheKey() == first.original_pixmap.cacheKey()
+        level = first._scale_source(QSize(150, 150))
+        assert level.size() == QSize(200, 200)
+        assert second._scale_source(QSize(150, 150)) is level
+
+        key = first._cache_key(str(path))
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        assert first._cache_key(str(path)) != key
+
+def test_drag_mime_data_serializes_pixmap_lazily(app):
+    """Starting a drag must not encode the pixmap; asking for bytes still works."""
+    from PySide6.QtGui import QPixmap
+    from src.widgets.cell import ImageMimeData
+
+    pix = QPixmap(8, 8)
+    with patch.object(QPixmap, "toImage", wraps=pix.toImage) as to_image:
+        mime = ImageMimeData(pix, None)
+        assert mime.hasFormat("application/x-pixmap")
+        assert "application/x-pixmap" in mime.formats()
+        to_image.assert_not_called()
+    assert mime.data("application/x-pixmap").size() > 0
+
+def test_empty_cells_share_cached_placeholder(app):
+    """Empty cells blit a shared pre-rendered placeholder instead of text."""
+    from PySide6.QtGui import QPainter
+    from src.widgets.cell import _placeholder_pixmap
+
+    first, second = CollageCell(1, 80), CollageCell(2, 80)
+    first.grab()
+    with patch.object(QPainter, "drawText") as draw_text:
+        second.grab()
+    draw_text.assert_not_called()
+    assert _placeholder_pixmap.cache_info().hits >= 1
+
+def test_swap_moves_autosave_payloads_instead_of_reencoding(app):
+    """Swapping two settled cells exchanges their encoded payloads."""
+    from PySide6.QtGui import QPixmap
+
+    first, second = CollageCell(1, 64), CollageCell(2, 64)
+    first_pix, second_pix = QPixmap(10, 10), QPixmap(20, 20)
+    with patch.object(CollageCell, "_schedule_autosave_encoding"):
+        first.setImage(first_pix)
+        second.setImage(second_pix)
+    first.set_autosave_payload("first")
+    second.set_autosave_payload("second")
+
+    with patch.object(CollageCell, "_schedule_autosave_encoding") as encode:
+        first._swap_image_with(second)
+    encode.assert_not_called()
+    assert first.original_pixmap is second_pix and second.pixmap is first_pix
+    assert (first.autosave_payload, second.autosave_payload) == ("second", "first")
+
+def test_empty_cell_paint_skips_smooth_pixmap_hint(app):
+    """Only cells that draw an image pay for smooth pixmap transforms."""
+    from PySide6.QtGui import QPainter, QPixmap
+
+    hints = []
+
+    def _record(painter, pixmap_or_x, *args):
+        hints.append(painter.renderHints())
+
+    cell = CollageCell(1, 64)
+    with patch.object(QPainter, "drawPixmap", _record):
+        cell.grab()
+        with patch.object(CollageCell, "_schedule_autosave_encoding"):
+            cell.setImage(QPixmap(64, 64))
+        cell.grab()
+    assert not hints[0] & QPainter.SmoothPixmapTransform
+    assert hints[-1] & QPainter.SmoothPixmapTransform
+
+def test_memory_sample_cleanup_uses_monotonic_interval(app):
+    """High samples trigger cleanup at most once per monotonic interval."""
+    from src import config
+
+    parent = QWidget()
+    with patch("src.managers.performance.QTimer"):
+        monitor = PerformanceMonitor(parent)
+    monitor.last_cleanup -= config.MEMORY_CLEANUP_INTERVAL_SECS
+    with patch.object(monitor, "_optimize") as optimize:
+        monitor._on_memory_sample(config.MEMORY_THRESHOLD_BYTES + 1)
+        monitor._on_memory_sample(config.MEMORY_THRESHOLD_BYTES + 1)
+    optimize.assert_called_once()
+
+def test_cleanup_resamples_memory_off_the_gui_thread(app):
+    """Cleanup never reads RSS inline; the follow-up sample decides on gc."""
+    from src import config
+
+    parent = QWidget()
+    with patch("src.managers.performance.QTimer"), patch(
+        "src.managers.performance.gc"
+    ) as gc_mod:
+        monitor = PerformanceMonitor(parent)
+        gc_mod.freeze.assert_not_called()
+        with patch.object(monitor, "_memory_usage") as usage, patch.object(
+            monitor, "_sample"
+        ) as sample:
+            monitor._optimize()
+        usage.assert_not_called()
+        sample.assert_called_once_with(monitor._on_cleanup_sample)
+        gc_mod.collect.assert_called_once_with(1)
+        monitor._on_cleanup_sample(config.MEMORY_THRESHOLD_BYTES + 1)
+    gc_mod.collect.assert_called_with()
+
+def test_error_recovery_counts_within_monotonic_window(app):
+    """Errors are counted per window and logged with their own traceback."""
+    from src import config
+    from src.managers.recovery import ErrorRecoveryManager
+
+    manager = ErrorRecoveryManager(None, MagicMock(), MagicMock())
+    error = ValueError("bad file")
+    with patch("src.managers.recovery.logging.error") as log:
+        manager.handle_error(error, "load")
+        manager.last_error_time -= config.ERROR_WINDOW_SECONDS + 1
+        manager.handle_error(error, "load")
+    assert manager.error_count == 1
+    assert log.call_args.kwargs["exc_info"] is error
@@ -1,4 +1,5 @@
 import builtins
+import json
 import logging
 import os
 from pathlib import Path
@@ -91,3 +92,88 @@ def test_cleanup_logs_warning(tmp_path, caplog, monkeypatch):
 
     assert any("cleanup failed" in r.message for r in caplog.records)
 
+
+
+def test_autosave_writes_compact_json(tmp_path):
+    manager = setup_manager(tmp_path)
+
+    manager.perform_autosave()
+    manager.wait_for_idle(timeout=1)
+
+    written = list(Path(manager.path).glob("collage_autosave_*.json"))
+    assert len(written) == 1
+    assert json.loads(written[0].read_bytes()) == {"foo": "bar"}
+
+
+def test_cleanup_keeps_newest_by_timestamp(tmp_path):
+    manager = setup_manager(tmp_path)
+    names = [
+        f"collage_autosave_20240101_0000{i:02d}.json"
+        for i in range(config.MAX_AUTOSAVE_FILES + 2)
+    ]
+    for name in names:
+        Path(manager.path, name).write_text("{}")
+    Path(manager.path, "unrelated.json").write_text("{}")
+
+    manager._cleanup_old()
+
+    remaining = sorted(p.name for p in Path(manager.path).glob("collage_autosave_*.json"))
+    assert remaining == names[2:]
+    assert Path(manager.path, "unrelated.json").exists()
+    assert manager.get_latest() == os.path.join(manager.path, names[-1])
+
+
+def test_autosave_skips_unchanged_state(tmp_path):
+    manager = setup_manager(tmp_path)
+    state = {"foo": "bar"}
+    manager.save_callback = lambda: dict(state)
+
+    manager.perform_autosave()
+    manager.wait_for_idle(timeout=1)
+    first = manager.get_latest()
+    os.remove(first)
+
+    manager.perform_autosave()
+    manager.wait_for_idle(timeout=1)
+    assert manager.get_latest() is None
+    assert autosave_metrics.counters["skipped"] == 1
+
+    state["foo"] = "baz"
+    manager.perform_autosave()
+    manager.wait_for_idle(timeout=1)
+    latest = manager.get_latest()
+    assert latest is not None
+    assert json.loads(Path(latest).read_bytes()) == {"foo": "baz"}
+
+
+def test_autosave_replaces_atomically(tmp_path, monkeypatch):
+    manager = setup_manager(tmp_path)
+    replaced: list[tuple[str, str]] = []
+    orig_replace = os.replace
+
+    def tracking_replace(src, dst):
+        replaced.append((src, dst))
+        return orig_replace(src, dst)
+
+    monkeypatch.setattr(os, "replace", tracking_replace)
+
+    manager.perform_autosave()
+    manager.wait_for_idle(timeout=1)
+
+    latest = manager.get_latest()
+    assert replaced == [(f"{latest}.tmp", latest)]
+    assert not any(p.suffix == ".tmp" for p in Path(manager.path).iterdir())
+
+
+def test_autosave_fsyncs_once_per_batch(tmp_path, monkeypatch):
+    manager = setup_manager(tmp_path)
+    monkeypatch.setattr(config, "AUTOSAVE_FSYNC_EVERY", 3)
+    synced: list[int] = []
+    monkeypatch.setattr(os, "fsync", synced.append)
+
+    for tick in range(6):
+        manager.save_callback = lambda tick=tick: {"tick": tick}
+        manager.perform_autosave()
+        manager.wait_for_idle(timeout=1)
+
+    assert len(synced) == 2
@@ -54,6 +54,17 @@ def test_lru_eviction_order() -> None:
     assert cache.get("c")[0] == "C"
 
 
+def test_put_evicts_single_oldest_entry_at_capacity() -> None:
+    """Inserting past capacity drops only the least recently used entry."""
+
+    cache = ImageCache(max_size=10, cleanup_threshold=0.5)
+    for i in range(6):
+        cache.put(str(i), i, {})
+
+    assert cache.get("0") == (None, None)
+    assert [key for key in cache._cache] == ["1", "2", "3", "4", "5"]
+
+
 def test_thread_safety() -> None:
     """Cache operations across threads should remain bounded by ``max_size``."""
 
@@ -71,3 +82,142 @@ def test_thread_safety() -> None:
         thread.join()
 
     assert len(cache._cache) <= cache.max_size
+
+
+def test_put_many_inserts_batch_and_evicts_once() -> None:
+    """Batched inserts should keep LRU order and respect the size bound."""
+
+    cache = ImageCache(max_size=4, cleanup_threshold=1.0)
+    cache.put("old", "O", {})
+    cache.put_many([(str(i), i, {"n": i}) for i in range(4)])
+
+    assert cache.get("old") == (None, None)
+    assert len(cache._cache) <= cache.max_size
+    assert cache.get("3") == (3, {"n": 3})
+
+
+def test_scaled_pixmap_cache_reuses_and_invalidates():
+    from PySide6.QtCore import QSize, Qt
+    from PySide6.QtGui import QPixmap
+    from PySide6.QtWidgets import QApplication
+    from src.cache import ScaledPixmapCache
+
+    if QApplication.instance() is None:
+        QApplication([])
+    cache = ScaledPixmapCache(max_size=2)
+    source = QPixmap(40, 20)
+    source.fill(Qt.red)
+    size = QSize(20, 20)
+
+    first = cache.get_or_scale(source, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    again = cache.get_or_scale(source, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    assert again is first
+    assert first.size() == QSize(20, 10)
+
+    other_mode = cache.get_or_scale(source, size, Qt.KeepAspectRatio, Qt.FastTransformation)
+    assert other_mode is not first
+
+    cache.invalidate(source)
+    assert cache.get_or_scale(source, size, Qt.KeepAspectRatio, Qt.SmoothTransformation) is not first
+
+
+def test_scaled_pixmap_cache_evicts_by_byte_budget():
+    from PySide6.QtCore import QSize, Qt
+    from PySide6.QtGui import QPixmap
+    from PySide6.QtWidgets import QApplication
+    from src.cache import ScaledPixmapCache
+
+    if QApplication.instance() is None:
+        QApplication([])
+    source = QPixmap(100, 100)
+    source.fill(Qt.blue)
+    one = ScaledPixmapCache._cost(source.scaled(QSize(50, 50)))
+    cache = ScaledPixmapCache(max_size=10, max_bytes=one + one // 2)
+
+    first = cache.get_or_scale(source, QSize(50, 50), Qt.KeepAspectRatio, Qt.FastTransformation)
+    cache.get_or_scale(source, QSize(40, 40), Qt.KeepAspectRatio, Qt.FastTransformation)
+    assert (
+        cache.get_or_scale(source, QSize(50, 50), Qt.KeepAspectRatio, Qt.FastTransformation)
+        is not first
+    )
+    assert cache._bytes <= cache.max_bytes
+
+
+def test_thumbnail_disk_cache_serves_unchanged_sources(tmp_path):
+    import os
+
+    from PySide6.QtCore import QSize
+    from PySide6.QtGui import QColor, QImage, QImageReader
+    from src.cache import get_thumbnail_cache
+    from src.optimizer import ImageOptimizer
+
+    source = tmp_path / "photo.png"
+    image = QImage(400, 200, QImage.Format_RGB32)
+    image.fill(QColor("navy"))
+    image.save(str(source))
+    size = QSize(40, 20)
+
+    first = ImageOptimizer.read_display_decode(QImageReader(str(source)), str(source), size)
+    assert first.size() == size
+    thumbnails = get_thumbnail_cache()
+    assert thumbnails.wait_for_idle(5000)
+    assert [name[-4:] for name in os.listdir(thumbnails.directory)] == [".jpg"]
+
+    # A hit never touches the reader.
+    unused = QImageReader(str(tmp_path / "missing.png"))
+    again = ImageOptimizer.read_display_decode(unused, str(source), size)
+    assert again.size() == size
+    assert abs(again.pixelColor(5, 5).blue() - 128) < 8
+
+    stat = os.stat(source)
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert thumbnails.load(str(source), size) is None
+
+
+def test_thumbnail_disk_cache_skips_jpeg_sources(tmp_path):
+    import os
+
+    from PySide6.QtCore import QSize
+    from PySide6.QtGui import QColor, QImage, QImageReader
+    from src.cache import get_thumbnail_cache
+    from src.optimizer import ImageOptimizer
+
+    source = tmp_path / "photo.jpg"
+    image = QImage(400, 200, QImage.Format_RGB32)
+    image.fill(QColor("olive"))
+    image.save(str(source))
+
+    decoded = ImageOptimizer.read_display_decode(
+        QImageReader(str(source)), str(source), QSize(40, 20)
+    )
+    assert decoded.size() == QSize(40, 20)
+    thumbnails = get_thumbnail_cache()
+    assert thumbnails.wait_for_idle(5000)
+    assert os.listdir(thumbnails.directory) == []
+
+
+def test_thumbnail_disk_cache_prunes_oldest_beyond_byte_budget(tmp_path):
+    import os
+
+    from PySide6.QtCore import QSize
+    from PySide6.QtGui import QImage
+    from src.cache import ThumbnailDiskCache
+
+    image = QImage(64, 64, QImage.Format_ARGB32_Premultiplied)
+    image.fill(0)
+    cache = ThumbnailDiskCache(str(tmp_path / "thumbs"), max_bytes=1 << 30)
+    entries = []
+    for index in range(3):
+        source = tmp_path / f"src{index}.png"
+        image.save(str(source))
+        cache.store(str(source), QSize(64, 64), image)
+        (entry,) = set(os.listdir(cache.directory)) - {os.path.basename(e) for e in entries}
+        entry = os.path.join(cache.directory, entry)
+        assert entry.endswith(".webp")
+        os.utime(entry, (index, index))
+        entries.append(entry)
+    cache.max_bytes = sum(os.path.getsize(entry) for entry in entries[1:])
+    cache.prune()
+    assert cache.load(str(tmp_path / "src0.png"), QSize(64, 64)) is None
+    assert cache.load(str(tmp_path / "src1.png"), QSize(64, 64)) is not None
+    assert cache.load(str(tmp_path / "src2.png"), QSize(64, 64)) is not None
@@ -73,3 +73,20 @@ def test_undo_redo_workflow():
     assert mgr.to_json() == aspect_json
     mgr.redo()
     assert mgr.to_json() == split_json
+
+
+def test_undo_history_is_bounded_and_isolated():
+    mgr = GridLayoutManager(1, 2, history_limit=2)
+    cell_id = mgr.cells[0].id
+    for ratio in ((1, 1), (4, 3), (16, 9)):
+        mgr.set_aspect(cell_id, aspect_mode="fixed", ratio=ratio)
+    assert len(mgr._undo_stack) == 2
+
+    mgr.undo()
+    assert mgr.cells[0].ratio == (4, 3)
+    mgr.undo()
+    assert mgr.cells[0].ratio == (1, 1)
+    with pytest.raises(ValueError):
+        mgr.undo()
+    mgr.redo()
+    assert mgr.cells[0].ratio == (4, 3)
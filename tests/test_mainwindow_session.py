@@ -178,6 +178,15 @@ def test_mainwindow_autosave_uses_current_state(main_window_factory):
     assert cell_payload["caption"] == "Snapshot"
 
 
+def _drain_task_queue() -> None:
+    from src.workers import get_task_queue
+
+    queue = get_task_queue()
+    while queue._queue or queue._running:
+        queue.thread_pool.waitForDone()
+        QApplication.processEvents()
+
+
 def test_add_images_validates_selection_paths(tmp_path, main_window_factory):
     create_window, _ = main_window_factory
     window = create_window()
@@ -196,6 +205,145 @@ def test_add_images_validates_selection_paths(tmp_path, main_window_factory):
     assert "Unsupported file extension" in errors[0]
 
 
+def test_add_images_fills_empty_cells_in_order(
+    monkeypatch, tmp_path, main_window_factory
+):
+    create_window, _ = main_window_factory
+    window = create_window()
+
+    colors = [QColor("red"), QColor("blue")]
+    paths = []
+    for index, color in enumerate(colors):
+        image = main_module.QImage(40, 30, main_module.QImage.Format_RGB32)
+        image.fill(color)
+        path = tmp_path / f"photo{index}.png"
+        assert image.save(str(path))
+        paths.append(str(path))
+    broken = tmp_path / "broken.png"
+    broken.write_bytes(b"not an image")
+    paths.insert(1, str(broken))
+
+    monkeypatch.setattr(
+        main_module.QFileDialog, "getOpenFileNames", lambda *_, **__: (paths, "")
+    )
+    infos: list[tuple[str, str]] = []
+    monkeypatch.setattr(
+        main_module.QMessageBox,
+        "information",
+        lambda parent, title, text: infos.append((title, text)),
+    )
+
+    window._add_images()
+    _drain_task_queue()
+
+    first = window.collage.get_cell_at(0, 0)
+    third = window.collage.get_cell_at(1, 0)
+    assert first.original_pixmap.toImage().pixelColor(0, 0) == colors[0]
+    assert window.collage.get_cell_at(0, 1).pixmap is None
+    assert third.original_pixmap.toImage().pixelColor(0, 0) == colors[1]
+    assert infos and "could not be decoded" in infos[0][1]
+
+
+def test_add_images_reuses_cached_decodes(monkeypatch, tmp_path, main_window_factory):
+    from src.cache import ImageCache, override_cache
+
+    create_window, _ = main_window_factory
+    window = create_window()
+    image = main_module.QImage(40, 30, main_module.QImage.Format_RGB32)
+    image.fill(QColor("green"))
+    path = tmp_path / "photo.png"
+    assert image.save(str(path))
+    monkeypatch.setattr(
+        main_module.QFileDialog, "getOpenFileNames", lambda *_, **__: ([str(path)], "")
+    )
+    decode = main_module.MainWindow._decode_for_cell
+    calls: list[str] = []
+
+    def _counting_decode(path, target):
+        calls.append(str(path))
+        return decode(path, target)
+
+    monkeypatch.setattr(main_module.MainWindow, "_decode_for_cell", staticmethod(_counting_decode))
+
+    with override_cache(ImageCache()):
+        window._add_images()
+        _drain_task_queue()
+        first = window.collage.get_cell_at(0, 0)
+        first.clearImage()
+        window._add_images()
+
+    assert len(calls) == 1
+    assert first.original_pixmap.toImage().pixelColor(0, 0) == QColor("green")
+
+
+def test_add_images_defers_original_decode_for_large_files(
+    monkeypatch, tmp_path, main_window_factory
+):
+    from unittest.mock import MagicMock
+
+    from src.cache import ImageCache, override_cache
+
+    create_window, _ = main_window_factory
+    window = create_window()
+    image = main_module.QImage(4000, 3000, main_module.QImage.Format_RGB32)
+    image.fill(QColor("green"))
+    path = tmp_path / "large.png"
+    assert image.save(str(path))
+    monkeypatch.setattr(
+        main_module.QFileDialog, "getOpenFileNames", lambda *_, **__: ([str(path)], "")
+    )
+    queue = MagicMock()
+    monkeypatch.setattr("src.widgets.cell.get_task_queue", lambda: queue)
+
+    with override_cache(ImageCache()):
+        window._add_images()
+        _drain_task_queue()
+        cell = window.collage.get_cell_at(0, 0)
+        assert cell.original_pixmap.width() < 4000
+        queue.add_task.call_args.args[0].run()
+
+    assert cell.original_pixmap.width() == 4000
+
+
+def test_add_images_returns_before_decodes_land(
+    monkeypatch, tmp_path, main_window_factory
+):
+    from unittest.mock import MagicMock
+
+    create_window, _ = main_window_factory
+    window = create_window()
+    paths = []
+    for index in range(2):
+        image = main_module.QImage(40, 30, main_module.QImage.Format_RGB32)
+        image.fill(QColor("red"))
+        path = tmp_path / f"photo{index}.png"
+        assert image.save(str(path))
+        paths.append(str(path))
+    monkeypatch.setattr(
+        main_module.QFileDialog, "getOpenFileNames", lambda *_, **__: (paths, "")
+    )
+    queue = MagicMock()
+    monkeypatch.setattr(main_module, "get_task_queue", lambda: queue)
+    captures = []
+    capture = window._capture_for_undo
+    monkeypatch.setattr(
+        window, "_capture_for_undo", lambda: captures.append(1) or capture()
+    )
+
+    window._add_images()
+
+    first = window.collage.get_cell_at(0, 0)
+    assert first.pixmap is None
+    workers = [c.args[0] for c in queue.add_task.call_args_list]
+    assert len(workers) == 2
+    for worker in workers:
+        worker.run()
+    QApplication.processEvents()
+    assert first.pixmap is not None
+    assert window.collage.get_cell_at(0, 1).pixmap is not None
+    assert captures == [1]
+
+
 def test_add_images_rejects_invalid_urls(monkeypatch, main_window_factory):
     create_window, _ = main_window_factory
     window = create_window()
@@ -324,3 +472,197 @@ def test_pick_color_integrates_with_undo(monkeypatch, main_window_factory):
     window._redo()
 
     assert cell.caption_stroke_color == new_color
+
+
+def test_export_finished_signal_reports_outcome(
+    monkeypatch, tmp_path, main_window_factory
+):
+    create_window, _ = main_window_factory
+    window = create_window()
+    saved = str(tmp_path / "a.png")
+
+    shown: list[tuple[str, str]] = []
+
+    def fake_dialog(parent, title, text):
+        shown.append((title, text))
+        return main_module.QMessageBox.StandardButton.Ok
+
+    monkeypatch.setattr(main_module.QMessageBox, "information", fake_dialog)
+    monkeypatch.setattr(main_module.QMessageBox, "critical", fake_dialog)
+
+    window.exportFinished.emit(True, {"path": saved, "original": None})
+    window.exportFinished.emit(False, {"error": "disk full"})
+
+    assert shown == [
+        ("Saved", f"Saved: {saved}"),
+        ("Error", "Could not save collage: disk full"),
+    ]
+
+
+def test_select_all_marks_every_cell(main_window_factory):
+    create_window, _ = main_window_factory
+    window = create_window()
+
+    window._select_all()
+
+    assert all(cell.selected for cell in window.collage.cells)
+    assert window.collage.updatesEnabled()
+
+    window.collage.set_all_selected(False)
+    assert not any(cell.selected for cell in window.collage.cells)
+
+
+def test_save_preview_is_rendered_at_preview_size(main_window_factory):
+    create_window, _ = main_window_factory
+    window = create_window()
+    window.collage.resize(600, 300)
+
+    preview = window._render_preview(300)
+
+    size = preview.deviceIndependentSize()
+    assert (round(size.width()), round(size.height())) == (300, 150)
+    assert not window._export_painter.isActive()
+
+
+def test_caption_changes_are_debounced(main_window_factory):
+    from PySide6.QtTest import QTest
+
+    create_window, _ = main_window_factory
+    window = create_window()
+    applied = []
+    window.caption_timer.timeout.disconnect()
+    window.caption_timer.timeout.connect(lambda: applied.append(1))
+
+    for _ in range(10):
+        window._schedule_caption_apply()
+    delay = main_module.config.CAPTION_UPDATE_DEBOUNCE_MS
+    assert window.caption_timer.interval() == delay
+
+    QTest.qWait(delay * 4)
+    assert applied == [1]
+
+
+def test_export_builds_images_in_worker(monkeypatch, tmp_path, main_window_factory):
+    from PySide6.QtGui import QImage, QPixmap
+    from src.workers import get_task_queue
+
+    create_window, _ = main_window_factory
+    window = create_window()
+    original = QPixmap(40, 30)
+    original.fill(QColor("red"))
+    window.collage.cells[0].setImage(original, original=original)
+
+    target = tmp_path / "out.jpg"
+    monkeypatch.setattr(window, "_select_save_path", lambda _fmt: str(target))
+    outcomes: list[tuple[bool, dict]] = []
+    window.exportFinished.disconnect()
+    window.exportFinished.connect(lambda ok, info: outcomes.append((ok, info)))
+
+    expected = window.collage.size()
+    window._export_collage(
+        window.SaveOptions(format="jpg", quality=90, resolution=1, save_original=True)
+    )
+    get_task_queue().thread_pool.waitForDone()
+    QApplication.processEvents()
+
+    assert outcomes and outcomes[0][0], outcomes
+    assert QImage(str(target)).size() == expected
+    original_out = QImage(str(tmp_path / "out_original.jpg"))
+    assert (original_out.width(), original_out.height()) == (40, 30)
+
+
+def test_compose_original_image_copies_tiles(qt_app):
+    from PySide6.QtCore import QPoint, QSize
+    from PySide6.QtGui import QImage
+
+    left = QImage(2, 2, QImage.Format_ARGB32)
+    left.fill(QColor(255, 0, 0, 128))
+    right = QImage(3, 1, QImage.Format_RGB32)
+    right.fill(QColor(0, 0, 255))
+
+    canvas = main_module.MainWindow._compose_original_image(
+        QSize(5, 2), [(QPoint(0, 0), left), (QPoint(2, 0), right)]
+    )
+
+    assert canvas.format() == QImage.Format_ARGB32_Premultiplied
+    red, _, _, alpha = canvas.pixelColor(1, 1).getRgb()
+    assert abs(red - 255) <= 1 and alpha == 128
+    assert canvas.pixelColor(4, 0).getRgb() == (0, 0, 255, 255)
+    assert canvas.pixelColor(4, 1).alpha() == 0
+
+
+def test_collage_indexes_follow_merge_and_split(main_window_factory):
+    create_window, _ = main_window_factory
+    window = create_window()
+    collage = window.collage
+    collage.update_grid(3, 3)
+
+    assert collage.merge_cells(0, 1, 2, 2, require_selection=False)
+    merged = collage.get_cell_at(0, 1)
+    assert merged is not None and collage.get_cell_position(merged) == (0, 1)
+    assert collage.get_cell_at(1, 2) is None
+    assert collage.merge_root_at(1, 2) == (0, 1)
+    assert collage.merge_root_at(2, 2) is None
+
+    # Selecting any part of the merge counts its whole block as selected.
+    collage.set_all_selected(False)
+    for pos in [(0, 0), (1, 0)]:
+        collage.get_cell_at(*pos).selected = True
+    merged.selected = True
+    assert collage.is_valid_merge(0, 0, 2, 3)
+
+    assert collage.split_cells(0, 1)
+    assert collage.merge_root_at(1, 2) is None
+    assert all(collage.get_cell_at(r, c) for r in range(3) for c in range(3))
+
+    state = collage.serialize_for_autosave()
+    collage.merge_cells(1, 1, 2, 2, require_selection=False)
+    collage.update_grid(2, 2)
+    collage.restore_from_serialized(state)
+    assert collage.merged_cells == {}
+    assert collage.merge_root_at(1, 1) is None
+    assert len(collage.cells) == 9
+
+
+def test_grid_shortcuts_are_scoped_to_collage(main_window_factory):
+    from PySide6.QtGui import QKeySequence, QShortcut
+
+    create_window, _ = main_window_factory
+    window = create_window()
+
+    scoped = {
+        sc.key().toString(): sc.context()
+        for sc in window.collage.findChildren(QShortcut)
+    }
+    assert scoped[QKeySequence(QKeySequence.SelectAll).toString()] == (
+        main_module.Qt.WidgetWithChildrenShortcut
+    )
+    assert set(scoped) >= {"Ctrl+M", "Ctrl+Shift+M"}
+    window_wide = {
+        sc.key().toString()
+        for sc in window.findChildren(QShortcut)
+        if sc.parent() is window
+    }
+    assert "Ctrl+O" in window_wide and "Ctrl+M" not in window_wide
+
+
+def test_write_image_jpeg_keeps_metadata(tmp_path, qt_app):
+    from PIL import Image
+    from PySide6.QtGui import QImage
+
+    image = QImage(16, 8, QImage.Format_RGB32)
+    image.fill(QColor(0, 128, 255))
+    image.setText("Software", "Collage Maker")
+    image.setDotsPerMeterX(11811)
+    image.setDotsPerMeterY(11811)
+    target = tmp_path / "out.jpg"
+
+    assert main_module.MainWindow._write_image(image, str(target), "jpg", 90)
+
+    with Image.open(target) as written:
+        assert written.size == (16, 8)
+        assert written.mode == "RGB"
+        assert tuple(round(v) for v in written.info["dpi"]) == (300, 300)
+        assert written.info["comment"] == b"Software: Collage Maker"
+        red, green, blue = written.getpixel((8, 4))
+        assert red < 8 and abs(green - 128) < 8 and blue > 245
@@ -0,0 +1,169 @@
+"""Tests for ImageOptimizer resampling helpers."""
+from __future__ import annotations
+
+from PySide6.QtCore import QSize
+from PySide6.QtGui import QColor, QImage
+from src.optimizer import ImageOptimizer
+
+
+def _solid(width: int, height: int, color: QColor) -> QImage:
+    image = QImage(width, height, QImage.Format_ARGB32)
+    image.fill(color)
+    return image
+
+
+def test_resample_upscales_to_exact_size() -> None:
+    source = _solid(10, 5, QColor(200, 40, 10))
+
+    result = ImageOptimizer.resample(source, QSize(40, 20))
+
+    assert result.size() == QSize(40, 20)
+    assert result.pixelColor(20, 10).getRgb() == (200, 40, 10, 255)
+
+
+def test_resample_downscale_averages_pixels() -> None:
+    source = _solid(4, 4, QColor(0, 0, 0))
+    for x in range(2):
+        for y in range(4):
+            source.setPixelColor(x, y, QColor(255, 255, 255))
+
+    result = ImageOptimizer.resample(source, QSize(1, 1))
+
+    red, green, blue, alpha = result.pixelColor(0, 0).getRgb()
+    assert abs(red - 128) <= 1 and red == green == blue
+    assert alpha == 255
+
+
+def test_resample_same_size_is_noop() -> None:
+    source = _solid(8, 8, QColor(1, 2, 3))
+
+    assert ImageOptimizer.resample(source, QSize(8, 8)) is source
+
+
+def test_resample_returns_straight_alpha() -> None:
+    source = _solid(4, 4, QColor(200, 100, 50, 128))
+
+    result = ImageOptimizer.resample(source, QSize(8, 8))
+
+    assert result.format() == QImage.Format_RGBA8888
+    red, green, blue, alpha = result.pixelColor(4, 4).getRgb()
+    assert alpha == 128
+    assert abs(red - 200) <= 2 and abs(green - 100) <= 2 and abs(blue - 50) <= 2
+
+
+def test_process_metadata_reads_header_only(tmp_path, monkeypatch) -> None:
+    path = tmp_path / "sample.png"
+    _solid(6, 3, QColor(10, 20, 30)).save(str(path))
+
+    def _fail_read(*_args, **_kwargs):
+        raise AssertionError("metadata extraction must not decode pixels")
+
+    monkeypatch.setattr("src.optimizer.QImageReader.read", _fail_read)
+    meta = ImageOptimizer.process_metadata(str(path))
+
+    assert meta["size"] == QSize(6, 3)
+    assert meta["format"] == "png"
+    assert meta["depth"] == 32
+    assert meta["timestamp"] == path.stat().st_mtime
+
+
+def test_pil_round_trip_preserves_pixels() -> None:
+    source = _solid(5, 3, QColor(12, 34, 56, 255))
+    source.setPixelColor(1, 2, QColor(250, 0, 125))
+
+    pil_image = ImageOptimizer.to_pil(source)
+    assert pil_image.size == (5, 3)
+    assert pil_image.getpixel((1, 2)) == (250, 0, 125, 255)
+
+    restored = ImageOptimizer.from_pil(pil_image)
+    assert restored.pixelColor(1, 2).getRgb() == (250, 0, 125, 255)
+    assert restored.pixelColor(0, 0).getRgb() == (12, 34, 56, 255)
+
+
+def test_scaled_decode_size_only_for_oversized_sources() -> None:
+    display = QSize(200, 100)
+
+    assert ImageOptimizer.scaled_decode_size(QSize(800, 400), display) is None
+    assert ImageOptimizer.scaled_decode_size(QSize(4000, 1000), display) == QSize(400, 100)
+
+
+def test_optimize_image_keeps_paint_ready_formats() -> None:
+    opaque = _solid(10, 10, QColor(1, 2, 3))
+    opaque = opaque.convertToFormat(QImage.Format_RGB32)
+    straight = _solid(10, 10, QColor(1, 2, 3, 100))
+
+    assert ImageOptimizer.optimize_image(opaque, QSize(10, 10)).format() == QImage.Format_RGB32
+    assert (
+        ImageOptimizer.optimize_image(straight, QSize(10, 10)).format()
+        == QImage.Format_ARGB32_Premultiplied
+    )
+
+
+def test_flatten_alpha_composites_over_white() -> None:
+    source = _solid(2, 1, QColor(0, 0, 0, 0))
+    source.setPixelColor(1, 0, QColor(255, 0, 0, 128))
+    source.setDotsPerMeterX(5000)
+    source.setText("Software", "Collage Maker")
+
+    flat = ImageOptimizer.flatten_alpha(source)
+
+    assert flat.format() == QImage.Format_RGB32
+    assert flat.pixelColor(0, 0).getRgb() == (255, 255, 255, 255)
+    red, green, blue, _ = flat.pixelColor(1, 0).getRgb()
+    assert red == 255 and abs(green - 127) <= 1 and green == blue
+    assert flat.dotsPerMeterX() == 5000
+    assert flat.text("Software") == "Collage Maker"
+
+    opaque = QImage(2, 2, QImage.Format_RGB32)
+    assert ImageOptimizer.flatten_alpha(opaque) is opaque
+
+
+def test_capped_decode_size_limits_largest_side(monkeypatch) -> None:
+    from src import config
+
+    monkeypatch.setattr(config, "MAX_IMAGE_DIMENSION", 100)
+    assert ImageOptimizer.capped_decode_size(QSize(80, 60)) is None
+    assert ImageOptimizer.capped_decode_size(QSize(400, 200)) == QSize(100, 50)
+
+
+def test_prepare_for_paint_converts_in_place() -> None:
+    straight = _solid(3, 3, QColor(255, 0, 0, 128))
+    ImageOptimizer.prepare_for_paint(straight)
+    assert straight.format() == QImage.Format_ARGB32_Premultiplied
+    assert straight.pixelColor(0, 0).getRgb() == (255, 0, 0, 128)
+
+    gray = QImage(3, 3, QImage.Format_Grayscale8)
+    gray.fill(QColor(90, 90, 90))
+    ImageOptimizer.prepare_for_paint(gray)
+    assert gray.format() == QImage.Format_RGB32
+    assert gray.pixelColor(1, 1).getRgb() == (90, 90, 90, 255)
+
+
+def test_to_pil_drop_alpha_returns_rgb() -> None:
+    pil_image = ImageOptimizer.to_pil(
+        _solid(3, 2, QColor(40, 80, 120)), drop_alpha=True
+    )
+    assert pil_image.mode == "RGB"
+    assert pil_image.getpixel((2, 1)) == (40, 80, 120)
+
+
+def test_mipmaps_halve_until_min_side_and_pick_covering_level() -> None:
+    source = _solid(400, 200, QColor(0, 0, 0))
+    levels = ImageOptimizer.build_mipmaps(source, min_side=40)
+
+    assert [(level.width(), level.height()) for level in levels] == [
+        (400, 200),
+        (200, 100),
+        (100, 50),
+    ]
+    assert ImageOptimizer.pick_mipmap(levels, QSize(90, 45)) is levels[2]
+    assert ImageOptimizer.pick_mipmap(levels, QSize(150, 75)) is levels[1]
+    assert ImageOptimizer.pick_mipmap(levels, QSize(800, 400)) is levels[0]
+
+
+def test_optimize_image_shares_images_that_already_fit() -> None:
+    small = _solid(20, 10, QColor(1, 2, 3)).convertToFormat(QImage.Format_RGB32)
+    large = _solid(200, 100, QColor(1, 2, 3)).convertToFormat(QImage.Format_RGB32)
+
+    assert ImageOptimizer.optimize_image(small, QSize(64, 64)).cacheKey() == small.cacheKey()
+    assert ImageOptimizer.optimize_image(large, QSize(64, 64)).size() == QSize(64, 32)
@@ -77,3 +77,93 @@ def test_session_controller_discards_latest_snapshot():
 
     with pytest.raises(RedoUnavailableError):
         controller.redo()
+
+
+def test_session_controller_snapshots_share_unchanged_parts():
+    payload = "x" * 1024
+    holder = {"cells": [{"image": payload, "caption": "a"}, {"image": None}]}
+
+    def read_state():
+        return {"cells": [dict(cell) for cell in holder["cells"]]}
+
+    def apply_state(state):
+        holder["cells"] = state["cells"]
+
+    controller = CollageSessionController(
+        CollageStateAdapter(read_state=read_state, apply_state=apply_state),
+        history_limit=2,
+    )
+    controller.capture_snapshot()
+    holder["cells"][1] = {"image": "y"}
+    controller.update_baseline()
+    controller.capture_snapshot()
+
+    first, second = controller._undo_stack
+    assert second["cells"][0] is first["cells"][0]
+    assert second["cells"][1] is not first["cells"][1]
+
+    controller.capture_snapshot()
+    assert len(controller._undo_stack) == 2
+
+    controller.undo()
+    assert holder["cells"][1] == {"image": "y"}
+
+
+def test_session_controller_evicts_oldest_over_byte_budget():
+    holder = {"image": "a" * 100}
+
+    def read_state():
+        return {"image": holder["image"]}
+
+    def apply_state(state):
+        holder["image"] = state["image"]
+
+    controller = CollageSessionController(
+        CollageStateAdapter(read_state=read_state, apply_state=apply_state),
+        history_limit=10,
+        max_history_bytes=250,
+    )
+    for fill in "bcd":
+        controller.capture_snapshot()
+        holder["image"] = fill * 100
+        controller.update_baseline()
+
+    # Three 100-byte entries exceed the budget, so the oldest is dropped.
+    assert [entry["image"][0] for entry in controller._undo_stack] == ["b", "c"]
+
+    controller.trim_history(0)
+    assert [entry["image"][0] for entry in controller._undo_stack] == ["c"]
+
+
+def test_trim_history_counts_shared_payloads_once_and_walks_each_entry_once(
+    monkeypatch,
+):
+    import src.controllers.session as session_module
+
+    holder = {"photo": "x" * 1000, "caption": "a" * 10}
+
+    def read_state():
+        return dict(holder)
+
+    def apply_state(state):
+        holder.update(state)
+
+    controller = CollageSessionController(
+        CollageStateAdapter(read_state=read_state, apply_state=apply_state),
+        history_limit=10,
+    )
+    for fill in "bcde":
+        controller.capture_snapshot()
+        holder["caption"] = fill * 10
+        controller.update_baseline()
+
+    walked = []
+    sizes = session_module._payload_sizes
+    monkeypatch.setattr(
+        session_module, "_payload_sizes", lambda entry: walked.append(1) or sizes(entry)
+    )
+    # The shared photo counts once: 1000 + 4 * 10 bytes, so two evictions fit.
+    controller.trim_history(1025)
+
+    assert [entry["caption"][0] for entry in controller._undo_stack] == ["c", "d"]
+    assert len(walked) == 4
@@ -0,0 +1,188 @@
+"""Tests for the background task queue."""
+from __future__ import annotations
+
+from src.workers import TaskQueue, Worker, prefetch_files
+
+
+class _RecordingPool:
+    """Thread pool stub that records started workers without running them."""
+
+    def __init__(self) -> None:
+        self.started: list[Worker] = []
+
+    def start(self, worker: Worker) -> None:
+        self.started.append(worker)
+
+
+def test_task_queue_orders_by_priority_then_fifo() -> None:
+    queue = TaskQueue()
+    pool = _RecordingPool()
+    queue.thread_pool = pool
+    queue._processing = True  # hold dispatch until all tasks are queued
+
+    low = Worker(lambda: None)
+    first_high = Worker(lambda: None)
+    second_high = Worker(lambda: None)
+    queue.add_task(low, priority=0)
+    queue.add_task(first_high, priority=5)
+    queue.add_task(second_high, priority=5)
+
+    for _ in range(3):
+        queue._process_next()
+
+    assert pool.started == [first_high, second_high, low]
+    assert queue.is_empty()
+
+
+def test_task_queue_bounds_concurrency_and_releases_finished() -> None:
+    queue = TaskQueue(max_concurrent=2)
+    pool = _RecordingPool()
+    queue.thread_pool = pool
+
+    workers = [Worker(lambda: None) for _ in range(3)]
+    for worker in workers:
+        queue.add_task(worker)
+
+    assert pool.started == workers[:2]
+    assert not queue.is_empty()
+
+    queue._release(workers[0])
+
+    assert pool.started == workers
+    assert queue.is_empty()
+
+
+def test_prefetch_files_preserves_order_and_reports_errors(tmp_path) -> None:
+    paths = []
+    for index in range(5):
+        path = tmp_path / f"file{index}.bin"
+        path.write_bytes(bytes([index]) * 3)
+        paths.append(str(path))
+    missing = str(tmp_path / "missing.bin")
+    paths.insert(2, missing)
+
+    results = list(prefetch_files(paths, depth=2))
+
+    assert [path for path, _ in results] == paths
+    assert isinstance(dict(results)[missing], OSError)
+    assert dict(results)[paths[-1]] == b"\x04\x04\x04"
+
+
+def test_batch_processor_decodes_in_parallel_and_caches_all(tmp_path, monkeypatch) -> None:
+    import threading
+
+    from PySide6.QtGui import QColor, QImage
+    from PySide6.QtWidgets import QApplication, QWidget
+    from src import config, workers
+    from src.cache import ImageCache, override_cache
+    from src.workers import BatchProcessor
+
+    if QApplication.instance() is None:
+        QApplication([])
+    paths = []
+    for index in range(6):
+        path = tmp_path / f"image{index}.png"
+        image = QImage(16, 16, QImage.Format_RGB32)
+        image.fill(QColor(index * 40, 0, 0))
+        image.save(str(path))
+        paths.append(str(path))
+    paths.insert(3, str(tmp_path / "missing.png"))
+
+    decode_threads = set()
+    decode = workers._decode_batch_image
+
+    def _recording_decode(*args):
+        decode_threads.add(threading.get_ident())
+        return decode(*args)
+
+    parent = QWidget()
+    processor = BatchProcessor(parent)
+    pool = _RecordingPool()
+    processor.thread_pool = pool
+    monkeypatch.setattr(workers, "_decode_batch_image", _recording_decode)
+    with override_cache(ImageCache(max_size=20)) as cache:
+        processor.process_files(paths)
+        pool.started[0].run()
+        cached = [path for path in paths if cache.get(path)[0] is not None]
+        # A second batch reuses the processor's decode threads.
+        cache.clear()
+        processor.process_files(paths)
+        pool.started[1].run()
+    assert cached == [path for path in paths if "missing" not in path]
+    assert threading.get_ident() not in decode_threads
+    assert len(decode_threads) <= config.IMAGE_LOAD_THREADS
+
+
+def test_batch_processor_skips_files_cached_at_current_mtime(tmp_path, monkeypatch) -> None:
+    import os
+
+    from PySide6.QtGui import QColor, QImage
+    from PySide6.QtWidgets import QApplication, QWidget
+    from src import workers
+    from src.cache import ImageCache, override_cache
+    from src.workers import BatchProcessor
+
+    if QApplication.instance() is None:
+        QApplication([])
+    paths = []
+    for index in range(3):
+        path = tmp_path / f"image{index}.png"
+        image = QImage(8, 8, QImage.Format_RGB32)
+        image.fill(QColor(0, index * 60, 0))
+        image.save(str(path))
+        paths.append(str(path))
+
+    decoded: list[str] = []
+    decode = workers._decode_batch_image
+
+    def _recording_decode(path, *args):
+        decoded.append(path)
+        return decode(path, *args)
+
+    processor = BatchProcessor(QWidget())
+    pool = _RecordingPool()
+    processor.thread_pool = pool
+    monkeypatch.setattr(workers, "_decode_batch_image", _recording_decode)
+    with override_cache(ImageCache(max_size=20)):
+        processor.process_files(paths)
+        pool.started[0].run()
+        assert sorted(decoded) == sorted(paths)
+
+        decoded.clear()
+        stat = os.stat(paths[1])
+        os.utime(paths[1], ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        processor.process_files(paths)
+        pool.started[1].run()
+    assert decoded == [paths[1]]
+
+
+def test_batch_processor_emits_each_percent_once(tmp_path) -> None:
+    from PySide6.QtGui import QColor, QImage
+    from PySide6.QtWidgets import QApplication, QWidget
+    from src.cache import ImageCache, override_cache
+    from src.workers import BatchProcessor
+
+    if QApplication.instance() is None:
+        QApplication([])
+    paths = []
+    for index in range(250):
+        path = tmp_path / f"image{index}.png"
+        if not paths:
+            image = QImage(2, 2, QImage.Format_RGB32)
+            image.fill(QColor("blue"))
+            image.save(str(path))
+        else:
+            path.write_bytes((tmp_path / "image0.png").read_bytes())
+        paths.append(str(path))
+
+    processor = BatchProcessor(QWidget())
+    pool = _RecordingPool()
+    processor.thread_pool = pool
+    emitted: list[int] = []
+    with override_cache(ImageCache(max_size=300)):
+        processor.process_files(paths)
+        worker = pool.started[0]
+        worker.signals.progress.connect(emitted.append)
+        worker.run()
+    assert emitted == sorted(set(emitted))
+    assert emitted[-1] == 100